@@ -2,14 +2,14 @@
 
 import os
 import sys
-import json
-from dotenv import load_dotenv
-
-# Add parent directory to path for direct import
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import traceback
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
 
 try:
-    from llm_completion import LiteLLMCompletion
+    from llm_completion import LiteLLMCompletion, _json
+    from llm_completion._env import load_dotenv_cached
     from llm_completion.implementations import (
         ShadcnToTypeScriptConverter,
         LandingPageTagFinder,
@@ -18,67 +18,33 @@ try:
     from llm_completion.exceptions import CompletionError, APIKeyError
 except ImportError as e:
     print(f"Error importing library: {e}")
-    print("Make sure the library is installed or in PYTHONPATH")
+    print("Make sure the library is installed (run `make dev` for an editable install)")
     sys.exit(1)
 
 
-def main():
-    """Run basic examples of the LLM completion library."""
-    # Load environment variables
-    load_dotenv()
-    
-    try:
-        # Check for API keys
-        if not os.getenv("GEMINI_API_KEY") and not os.getenv("OPENAI_API_KEY"):
-            print("ERROR: No API keys found! Please set GEMINI_API_KEY or OPENAI_API_KEY in environment variables")
-            sys.exit(1)
-    
-        # Basic completion example
-        print("\n===== Basic Completion =====")
-        completion = LiteLLMCompletion()
-        # result = completion.complete("Explain quantum computing in simple terms")
-        # print(result)
-        
-        # JSON completion example
-        print("\n===== JSON Completion =====")
-        # json_result = completion.complete_with_json(
-        #     "List 3 planets in our solar system with their key features"
-        # )
-        # print(json_result)
-        
-        # JSON completion with schema example
-        print("\n===== JSON Completion with Schema =====")
-        schema = {
-            "type": "object",
-            "properties": {
-                "planets": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "diameter_km": {"type": "number"},
-                            "has_rings": {"type": "boolean"},
-                            "description": {"type": "string"}
-                        },
-                        "required": ["name", "diameter_km", "has_rings"]
-                    }
-                }
-            },
-            "required": ["planets"]
+# Schema for the JSON-completion-with-schema example
+PLANETS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "planets": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "diameter_km": {"type": "number"},
+                    "has_rings": {"type": "boolean"},
+                    "description": {"type": "string"}
+                },
+                "required": ["name", "diameter_km", "has_rings"]
+            }
         }
-        
-        # Uncomment to run example
-        # json_result_with_schema = completion.complete_with_json(
-        #     "List 3 planets in our solar system with their key features",
-        #     json_schema=schema
-        # )
-        # print(json.dumps(json_result_with_schema, indent=2))
-        
-        # Shadcn to TypeScript example
-        print("\n===== Shadcn to TypeScript =====")
-        converter = ShadcnToTypeScriptConverter()
-        component_code = """
+    },
+    "required": ["planets"]
+}
+
+# Shadcn component converted in the TypeScript example
+COMPONENT_CODE = """
 import { cn } from "@/lib/utils"
 import { Button } from "@/components/ui/button"
 import { Mockup } from "@/components/ui/mockup"
@@ -224,113 +190,213 @@ export function HeroWithMockup({
 
 """
 
-        result = converter.convert(component_code)
-        print("Results are:")
-        print(json.dumps(result, indent=2))
-
-        # Landing page tags example
-        
-        print("\n===== Landing Page Tags =====")
-        tag_finder = LandingPageTagFinder()
-        user_input = """
+# Landing page description used by the tag example
+USER_INPUT = """
         Landing Page Goal: generate-leads
 Target Audience: b2b
 Product Type: digital-product
 Product Name: MarketingKore
 Description: MarketingKore is an AI marketing tool. That will provide landing page creation in the starting and grow it into more AI tools such as AI Forms, AI Websites, etc
         """
-        # The LandingPageTagFinder now uses complete_with_json with a json_schema parameter
-        # to enforce consistent output structure with categories and tags
-        # tags = tag_finder.get_category_tags_map(user_input=user_input, count=5)
-        # print(json.dumps(tags, indent=2))
+
+# Component props schema filled in by the JSON generator example
+COMPONENT_SCHEMA = {
+  "badge": {
+    "type": "object",
+    "properties": {
+      "text": {
+        "type": "string"
+      },
+      "action": {
+        "type": "object",
+        "properties": {
+          "text": {
+            "type": "string"
+          },
+          "href": {
+            "type": "string"
+          }
+        },
+        "required": ["text", "href"],
+        "additionalProperties": False
+      }
+    },
+    "required": ["text", "action"],
+    "additionalProperties": False
+  },
+  "title": {
+    "type": "string"
+  },
+  "description": {
+    "type": "string"
+  },
+  "actions": {
+    "type": "array",
+    "items": {
+      "type": "object",
+      "properties": {
+        "text": {
+          "type": "string"
+        },
+        "href": {
+          "type": "string"
+        },
+        "icon": {
+          "type": "object",
+          "description": "Represents all of the things React can render.\n\nWhere {@link ReactElement} only represents JSX, `ReactNode` represents everything that can be rendered.",
+          "additionalProperties": False
+        },
+        "variant": {
+          "enum": [
+            "default",
+            "glow"
+          ],
+          "type": "string"
+        }
+      },
+      "required": ["text", "href", "variant"],
+      "additionalProperties": False
+    }
+  },
+  "image": {
+    "type": "object",
+    "properties": {
+      "light": {
+        "type": "string"
+      },
+      "dark": {
+        "type": "string"
+      },
+      "alt": {
+        "type": "string"
+      }
+    },
+    "required": ["light", "dark", "alt"],
+    "additionalProperties": False
+  }
+}
+
+API_KEY_VARS = ("GEMINI_API_KEY", "OPENAI_API_KEY")
+
+
+@dataclass(frozen=True)
+class Example:
+    """Inputs for one run of the converter, tag finder and generator examples."""
+
+    name: str
+    component_code: str
+    user_input: str
+    schema: Dict[str, Any]
+    data_prompt: str
+
+
+EXAMPLES: List[Example] = [
+    Example(
+        name="hero-with-mockup",
+        component_code=COMPONENT_CODE,
+        user_input=USER_INPUT,
+        schema=COMPONENT_SCHEMA,
+        data_prompt="Create hero section for a landing page of oneclosure.com",
+    ),
+]
+
+
+async def run_example(
+    example: Example,
+    converter: ShadcnToTypeScriptConverter,
+    tag_finder: LandingPageTagFinder,
+    generator: JsonSchemaDataGenerator,
+) -> Tuple[Any, Any, Any]:
+    """Run the converter, tag finder and generator concurrently for one example.
+
+    Args:
+        example: The example inputs.
+        converter: Converter for the component code.
+        tag_finder: Tag finder for the landing page description.
+        generator: Generator for the component schema.
+
+    Returns:
+        Tuple of (converted component, category tags, generated data).
+    """
+    return await asyncio.gather(
+        converter.aconvert(example.component_code),
+        tag_finder.aget_category_tags_map(user_input=example.user_input, count=5),
+        generator.agenerate_data(example.schema, example.data_prompt, num_examples=1),
+    )
+
+
+async def run_all(examples: List[Example]):
+    """Run basic examples of the LLM completion library.
+
+    Args:
+        examples: The examples to run.
+    """
+    # Load environment variables
+    load_dotenv_cached()
+    
+    try:
+        # Check for API keys
+        if not any(map(os.environ.get, API_KEY_VARS)):
+            print("ERROR: No API keys found! Please set GEMINI_API_KEY or OPENAI_API_KEY in environment variables")
+            sys.exit(1)
+    
+        completion = LiteLLMCompletion(enable_cache=True, max_concurrency=3)
+
+        # JSON completion example
+        print("\n===== JSON Completion =====")
+        # json_result = completion.complete_with_json(
+        #     "List 3 planets in our solar system with their key features"
+        # )
+        # print(json_result)
         
+        # JSON completion with schema example
+        print("\n===== JSON Completion with Schema =====")
+        # Uncomment to run example
+        # json_result_with_schema = completion.complete_with_json(
+        #     "List 3 planets in our solar system with their key features",
+        #     json_schema=PLANETS_SCHEMA
+        # )
+        # print(_json.dumps(json_result_with_schema, indent=2))
         
+        # Shadcn to TypeScript example
+        print("\n===== Shadcn to TypeScript =====")
+        converter = ShadcnToTypeScriptConverter(completion)
+
+        # Landing page tags example
+        # The LandingPageTagFinder uses complete_with_json with a json_schema parameter
+        # to enforce consistent output structure with categories and tags
+        tag_finder = LandingPageTagFinder(completion, use_api=True)
+
         # JSON generator example
-        # print("\n===== JSON Generator =====")
-        # generator = JsonSchemaDataGenerator()
-        # component_schema = {
-        #   "badge": {
-        #     "type": "object",
-        #     "properties": {
-        #       "text": {
-        #         "type": "string"
-        #       },
-        #       "action": {
-        #         "type": "object",
-        #         "properties": {
-        #           "text": {
-        #             "type": "string"
-        #           },
-        #           "href": {
-        #             "type": "string"
-        #           }
-        #         },
-        #         "required": ["text", "href"],
-        #         "additionalProperties": False
-        #       }
-        #     },
-        #     "required": ["text", "action"],
-        #     "additionalProperties": False
-        #   },
-        #   "title": {
-        #     "type": "string"
-        #   },
-        #   "description": {
-        #     "type": "string"
-        #   },
-        #   "actions": {
-        #     "type": "array",
-        #     "items": {
-        #       "type": "object",
-        #       "properties": {
-        #         "text": {
-        #           "type": "string"
-        #         },
-        #         "href": {
-        #           "type": "string"
-        #         },
-        #         "icon": {
-        #           "type": "object",
-        #           "description": "Represents all of the things React can render.\n\nWhere {@link ReactElement} only represents JSX, `ReactNode` represents everything that can be rendered.",
-        #           "additionalProperties": False
-        #         },
-        #         "variant": {
-        #           "enum": [
-        #             "default",
-        #             "glow"
-        #           ],
-        #           "type": "string"
-        #         }
-        #       },
-        #       "required": ["text", "href", "variant"],
-        #       "additionalProperties": False
-        #     }
-        #   },
-        #   "image": {
-        #     "type": "object",
-        #     "properties": {
-        #       "light": {
-        #         "type": "string"
-        #       },
-        #       "dark": {
-        #         "type": "string"
-        #       },
-        #       "alt": {
-        #         "type": "string"
-        #       }
-        #     },
-        #     "required": ["light", "dark", "alt"],
-        #     "additionalProperties": False
-        #   }
-        # }
-        
-        # # This will internally use complete_with_json with the json_schema parameter
-        # data = generator.generate_data(
-        #     component_schema,
-        #     "Create hero section for a landing page of oneclosure.com",
-        #     num_examples=1
-        # )
-        # print(json.dumps(data, indent=2))
+        generator = JsonSchemaDataGenerator(completion)
+
+        # The examples are independent, so run all of their LLM calls concurrently
+        # over a single pooled HTTP session
+        async with completion:
+            # Basic completion example, written to stdout as tokens arrive
+            print("\n===== Basic Completion =====")
+            async for token in completion.astream("Explain quantum computing in simple terms"):
+                sys.stdout.write(token)
+                sys.stdout.flush()
+            print()
+
+            results = await asyncio.gather(
+                *(run_example(example, converter, tag_finder, generator) for example in examples)
+            )
+
+        for example, (result, tags, data) in zip(examples, results):
+            print(f"\n===== Example: {example.name} =====")
+            print("Results are:")
+            print(_json.dumps(result, indent=2))
+
+            print("\n===== Landing Page Tags =====")
+            print(_json.dumps(tags, indent=2))
+
+            print("\n===== JSON Generator =====")
+            print(_json.dumps(data, indent=2))
+
+        print(f"\nResponse cache: {completion.cache.stats}")
+        print(f"Token usage: {completion.usage}")
 
     except APIKeyError as e:
         print(f"API Key Error: {str(e)}")
@@ -341,9 +407,8 @@ Description: MarketingKore is an AI marketing tool. That will provide landing pa
     
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(run_all(EXAMPLES))
\ No newline at end of file
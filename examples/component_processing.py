@@ -1,17 +1,18 @@
 """Example of component processing in the LLM completion library."""
 
+import argparse
+import asyncio
 import sys
 import os
-import json
-
-# Add parent directory to path for direct import
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import traceback
+from typing import List, Tuple
 
 try:
+    from llm_completion import _json
     from llm_completion.component_processor import ComponentProcessor
 except ImportError as e:
     print(f"Error importing library: {e}")
-    print("Make sure the library is installed or in PYTHONPATH")
+    print("Make sure the library is installed (run `make dev` for an editable install)")
     sys.exit(1)
 
 
@@ -51,76 +52,95 @@ export default FeatureCard
 """
 
 
-def process_example_component():
+def _flush_outputs(output_dir: str, files: List[Tuple[str, bytes]]) -> None:
+    """Write pre-built output payloads, one write per file.
+
+    Args:
+        output_dir: Directory to write the files into.
+        files: (file name, contents) pairs.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    for file_name, payload in files:
+        with open(os.path.join(output_dir, file_name), "wb") as f:
+            f.write(payload)
+
+
+async def process_example_component(processor: ComponentProcessor, verbose: bool = False):
     """Process an example shadcn component."""
     print("Processing example Button component...")
     
-    # Create a processor
-    processor = ComponentProcessor()
+    # Process the component in a worker thread so the examples overlap
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, processor.process_component, EXAMPLE_COMPONENT, "Button.jsx")
     
-    # Process the component
-    result = processor.process_component(EXAMPLE_COMPONENT, "Button.jsx")
-    
-    # Print the result
-    print("\nProcessing result:")
-    print(json.dumps(result, indent=2))
+    # Serialize once for both the printout and the metadata file
+    metadata = _json.dumps(result, indent=2)
+
+    # Print the result; the full JSON only when verbose
+    if verbose:
+        print("\nProcessing result:")
+        sys.stdout.write(metadata + "\n")
+    else:
+        component = result["component"]
+        print(f"\nGenerated {component['file_name']} ({len(component['typescript_code'])} bytes)")
     
     # For demonstration, also save the files
     output_dir = os.path.join(os.path.dirname(__file__), "output")
-    os.makedirs(output_dir, exist_ok=True)
-    
-    component_path = os.path.join(output_dir, result["component"]["file_name"])
-    props_path = os.path.join(output_dir, result["props"]["file_name"])
-    metadata_path = os.path.join(output_dir, "button_metadata.json")
-    
-    with open(component_path, "w") as f:
-        f.write(result["component"]["typescript_code"])
-        
-    with open(props_path, "w") as f:
-        f.write(result["props"]["code"])
-        
-    with open(metadata_path, "w") as f:
-        json.dump(result, f, indent=2)
+    await loop.run_in_executor(None, _flush_outputs, output_dir, [
+        (result["component"]["file_name"], result["component"]["typescript_code"].encode("utf-8")),
+        ("button_metadata.json", metadata.encode("utf-8")),
+    ])
         
     print(f"\nFiles saved to {output_dir}")
 
 
-def process_component_with_icon():
+async def process_component_with_icon(processor: ComponentProcessor, verbose: bool = False):
     """Process an example component with icons."""
     print("\nProcessing example FeatureCard component with icons...")
     
-    # Create a processor
-    processor = ComponentProcessor()
-    
-    # Process the component
-    result = processor.process_component(EXAMPLE_COMPONENT_WITH_ICON, "FeatureCard.jsx")
+    # Process the component in a worker thread so the examples overlap
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, processor.process_component, EXAMPLE_COMPONENT_WITH_ICON, "FeatureCard.jsx")
     
-    # Print the result
-    print("\nProcessing result:")
-    print(json.dumps(result, indent=2))
+    # Serialize once for both the printout and the metadata file
+    metadata = _json.dumps(result, indent=2)
+
+    # Print the result; the full JSON only when verbose
+    if verbose:
+        print("\nProcessing result:")
+        sys.stdout.write(metadata + "\n")
+    else:
+        component = result["component"]
+        print(f"\nGenerated {component['file_name']} ({len(component['typescript_code'])} bytes)")
     
     # For demonstration, also save the files
     output_dir = os.path.join(os.path.dirname(__file__), "output")
-    os.makedirs(output_dir, exist_ok=True)
-    
-    component_path = os.path.join(output_dir, result["component"]["file_name"])
-    props_path = os.path.join(output_dir, result["props"]["file_name"])
-    metadata_path = os.path.join(output_dir, "feature_card_metadata.json")
-    
-    with open(component_path, "w") as f:
-        f.write(result["component"]["typescript_code"])
-        
-    with open(props_path, "w") as f:
-        f.write(result["props"]["code"])
-        
-    with open(metadata_path, "w") as f:
-        json.dump(result, f, indent=2)
+    await loop.run_in_executor(None, _flush_outputs, output_dir, [
+        (result["component"]["file_name"], result["component"]["typescript_code"].encode("utf-8")),
+        ("feature_card_metadata.json", metadata.encode("utf-8")),
+    ])
         
     print(f"\nFiles saved to {output_dir}")
 
 
+async def _run_examples(verbose: bool = False):
+    """Run both example components concurrently."""
+    # One processor, and so one completion provider, serves every example
+    processor = ComponentProcessor()
+
+    await asyncio.gather(
+        process_example_component(processor, verbose),
+        process_component_with_icon(processor, verbose),
+    )
+
+
 def main():
     """Run component processing examples."""
+    parser = argparse.ArgumentParser(description="Component processing example")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print full processing results")
+    args = parser.parse_args()
+
     print("LLM Completion Library - Component Processing Example")
     
     try:
@@ -129,13 +149,11 @@ def main():
             print("ERROR: No API keys found! Please set GEMINI_API_KEY or OPENAI_API_KEY environment variables")
             sys.exit(1)
             
-        # Process example components
-        process_example_component()
-        process_component_with_icon()
+        # Process example components concurrently
+        asyncio.run(_run_examples(args.verbose))
         
     except Exception as e:
         print(f"Error in example: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 
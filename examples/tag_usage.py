@@ -1,19 +1,17 @@
 """Examples of tag functionality in the LLM completion library."""
 
+import argparse
 import sys
-import os
-import json
+import traceback
 from typing import List, Dict, Any
 
-# Add parent directory to path for direct import
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 try:
+    from llm_completion import _json
     from llm_completion.tag_manager import TagManager
     from llm_completion.implementations.landing_tags import LandingPageTagFinder
 except ImportError as e:
     print(f"Error importing library: {e}")
-    print("Make sure the library is installed or in PYTHONPATH")
+    print("Make sure the library is installed (run `make dev` for an editable install)")
     sys.exit(1)
 
 
@@ -80,8 +78,30 @@ def example_component_tagging() -> None:
         print()
 
 
-def example_page_analysis() -> None:
-    """Demonstrate page analysis functionality."""
+def print_analysis(title: str, analysis: Dict[str, Any], verbose: bool) -> None:
+    """Print a page analysis, in full only when verbose.
+
+    Args:
+        title: Heading for the analysis.
+        analysis: The analysis result.
+        verbose: Whether to print the full JSON.
+    """
+    print(title)
+    if verbose:
+        sys.stdout.write(_json.dumps(analysis, indent=2) + "\n")
+    else:
+        print(f"  Components: {analysis['component_count']}")
+        print(f"  Missing sections: {', '.join(analysis['missing_sections']) or 'none'}")
+        for recommendation in analysis["recommendations"]:
+            print(f"  - {recommendation}")
+
+
+def example_page_analysis(verbose: bool = False) -> None:
+    """Demonstrate page analysis functionality.
+
+    Args:
+        verbose: Whether to print the full analysis JSON.
+    """
     print_section("Page Analysis Example")
     
     tag_finder = LandingPageTagFinder(use_api=False)
@@ -98,8 +118,7 @@ def example_page_analysis() -> None:
     # Analyze the structure
     analysis = tag_finder.analyze_component_structure(components)
     
-    print("Landing page analysis:")
-    print(json.dumps(analysis, indent=2))
+    print_analysis("Landing page analysis:", analysis, verbose)
     print()
     
     # Example of incomplete structure
@@ -110,12 +129,15 @@ def example_page_analysis() -> None:
     
     incomplete_analysis = tag_finder.analyze_component_structure(incomplete)
     
-    print("Incomplete landing page analysis:")
-    print(json.dumps(incomplete_analysis, indent=2))
+    print_analysis("Incomplete landing page analysis:", incomplete_analysis, verbose)
 
 
 def main() -> None:
     """Run tag functionality examples."""
+    parser = argparse.ArgumentParser(description="Tag functionality examples")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print full analysis results")
+    args = parser.parse_args()
+
     print("LLM Completion Library - Tag Functionality Examples")
     
     try:
@@ -123,11 +145,10 @@ def main() -> None:
         example_tag_search()
         example_component_recommendations()
         example_component_tagging()
-        example_page_analysis()
+        example_page_analysis(args.verbose)
         
     except Exception as e:
         print(f"Error running examples: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 
@@ -1,7 +1,9 @@
 """LLM Completion library using LiteLLM."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import CompletionProvider
-from .completion import LiteLLMCompletion
 from .exceptions import (
     CompletionError,
     APIKeyError,
@@ -12,9 +14,38 @@ from .exceptions import (
 )
 from .tag_manager import TagManager
 
+if TYPE_CHECKING:
+    from .async_caller import AsyncCaller
+    from .cache import LLMCache, MemoryCache
+    from .completion import LiteLLMCompletion, get_default_completion
+
+# Exports backed by litellm/httpx, imported on first access so local-only
+# users (e.g. the tag tools) do not pay for loading them
+_LAZY_EXPORTS = {
+    "AsyncCaller": ".async_caller",
+    "LLMCache": ".cache",
+    "MemoryCache": ".cache",
+    "LiteLLMCompletion": ".completion",
+    "get_default_completion": ".completion",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "AsyncCaller",
     "CompletionProvider",
+    "LLMCache",
+    "MemoryCache",
     "LiteLLMCompletion",
+    "get_default_completion",
     "CompletionError",
     "APIKeyError",
     "RateLimitError",
@@ -22,4 +53,4 @@ __all__ = [
     "InvalidRequestError",
     "LLMTimeoutError",
     "TagManager",
-]
\ No newline at end of file
+]
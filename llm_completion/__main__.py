@@ -3,8 +3,6 @@
 import sys
 import argparse
 
-from .cli.tag_tool import main as tag_tool_main
-from .cli.component_tool import main as component_tool_main
 from .logger import setup_logger
 
 
@@ -46,11 +44,14 @@ def main() -> int:
     if args.tool == "tags":
         # Reconstruct sys.argv for the tag tool
         sys.argv = [sys.argv[0]] + [args.command] + args.args
+        # Imported per tool so the tag tool does not load the LLM stack
+        from .cli.tag_tool import main as tag_tool_main
         return tag_tool_main()
         
     elif args.tool == "component":
         # Reconstruct sys.argv for the component tool
         sys.argv = [sys.argv[0]] + [args.command] + args.args
+        from .cli.component_tool import main as component_tool_main
         return component_tool_main()
         
     else:
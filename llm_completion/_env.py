@@ -0,0 +1,46 @@
+"""Cached loading of ``.env`` files."""
+
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+from dotenv import dotenv_values, find_dotenv
+
+
+@lru_cache(maxsize=1)
+def _parse(path: str, mtime: int) -> Dict[str, Optional[str]]:
+    """Parse a ``.env`` file; cached per path and modification time."""
+    return dotenv_values(path)
+
+
+def load_dotenv_cached(path: Optional[str] = None, override: bool = False) -> bool:
+    """Load variables from a ``.env`` file into the environment.
+
+    The parsed file is memoized on its path and modification time, so repeated
+    calls in the same process do not re-read an unchanged file.
+
+    Args:
+        path: Path to the ``.env`` file. If not provided, the nearest ``.env``
+            in the current directory or its parents is used, as with
+            ``load_dotenv()``.
+        override: Whether to override variables already set in the environment.
+
+    Returns:
+        True if the file was found and loaded, False otherwise.
+    """
+    if path is None:
+        path = find_dotenv(usecwd=True)
+        if not path:
+            return False
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+
+    for key, value in _parse(os.path.abspath(path), st.st_mtime_ns).items():
+        if value is None or (key in os.environ and not override):
+            continue
+        os.environ[key] = value
+
+    return True
@@ -0,0 +1,73 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause
+# covers both backends.
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types neither backend handles natively.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        A JSON-serializable representation of the object.
+
+    Raises:
+        TypeError: If the object cannot be serialized.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: Optional[int] = None, default: Callable[[Any], Any] = _default) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: The object to serialize.
+        indent: Optional indentation; orjson only supports an indent of 2.
+        default: Fallback serializer for unsupported types. Handles sets and
+            dates by default.
+
+    Returns:
+        The JSON string.
+    """
+    if orjson is not None and indent in (None, 2):
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # Types orjson rejects (e.g. non-string keys) go through the stdlib
+            pass
+
+    return json.dumps(obj, indent=indent, default=default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The parsed object.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -0,0 +1,74 @@
+"""Bounded-concurrency async caller with retries for LLM requests."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import litellm
+from tenacity import (
+    AsyncRetrying,
+    stop_after_attempt,
+    wait_random_exponential,
+    retry_if_exception_type,
+    before_sleep_log,
+)
+
+from .logger import logger
+
+T = TypeVar("T")
+
+# Transient provider errors worth retrying before falling back
+RETRYABLE_ERRORS = (
+    litellm.exceptions.RateLimitError,
+    litellm.exceptions.APIConnectionError,
+    litellm.exceptions.Timeout,
+)
+
+
+class AsyncCaller:
+    """Run coroutines under a concurrency limit, retrying transient failures."""
+
+    def __init__(self, max_concurrency: int = 32, max_retries: int = 6) -> None:
+        """Initialize the caller.
+
+        Args:
+            max_concurrency: Maximum number of calls in flight at once.
+            max_retries: Maximum number of attempts per call.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Await ``fn(*args, **kwargs)`` with concurrency limiting and retries.
+
+        Args:
+            fn: The coroutine function to call.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            Exception: The last error raised by ``fn`` once retries are exhausted,
+                or any non-retryable error immediately.
+        """
+        # Created lazily so the semaphore binds to the running event loop, and
+        # recreated when a shared caller is reused from a new loop
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+
+        async with self._sem:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.max_retries),
+                wait=wait_random_exponential(multiplier=1, max=30),
+                retry=retry_if_exception_type(RETRYABLE_ERRORS),
+                before_sleep=before_sleep_log(logger, logging.INFO),
+                reraise=True,
+            ):
+                with attempt:
+                    return await fn(*args, **kwargs)
@@ -0,0 +1,174 @@
+"""Response caching for the LLM completion library."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from . import _json
+from .logger import logger
+
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "llm_completion")
+
+
+def make_cache_key(
+    model: Any,
+    messages: Any,
+    temperature: Any,
+    schema: Optional[str] = None,
+) -> str:
+    """Build a deterministic cache key for a completion request.
+
+    Args:
+        model: The model (or list of fallback models) serving the request.
+        messages: The messages sent to the model.
+        temperature: The sampling temperature.
+        schema: Optional serialized JSON schema the response must follow.
+
+    Returns:
+        Hex digest identifying the request.
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages, "schema": schema, "temp": temperature},
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed on-disk cache for LLM responses."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache database.
+        """
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = os.path.join(directory, "responses.sqlite3")
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        # Drop entries that expired since the cache was last used
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+        )
+        self._conn.commit()
+
+        logger.info(f"Initialized LLMCache at {self.path}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response, or None if missing or expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            if row[1] is not None and row[1] < time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+
+        return _json.loads(row[0])
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: The cache key.
+            value: The JSON-serializable response to store.
+            expire: Optional lifetime of the entry in seconds.
+        """
+        expires_at = time.time() + expire if expire is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, _json.dumps(value), expires_at),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryCache:
+    """Bounded in-process LRU cache for LLM responses.
+
+    Values are stored serialized, so callers that mutate a returned response
+    cannot corrupt later hits.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept; the least recently
+                used entry is evicted beyond this.
+        """
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            A fresh copy of the cached response, or None if missing.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+
+        return _json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: The cache key.
+            value: The JSON-serializable response to store.
+        """
+        serialized = _json.dumps(value)
+
+        with self._lock:
+            self._entries[key] = serialized
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -1,11 +1,11 @@
 """CLI for component processing operations."""
 
 import argparse
-import json
 import sys
 import os
 from typing import Dict, Any
 
+from .. import _json
 from ..component_processor import ComponentProcessor
 from ..implementations.shadcn_to_ts import ShadcnToTypeScriptConverter
 from ..implementations.json_generator import JsonSchemaDataGenerator
@@ -77,17 +77,17 @@ def read_json_file(file_path: str) -> Dict[str, Any]:
     Raises:
         FileNotFoundError: If the file does not exist.
         IOError: If there's an error reading the file.
-        json.JSONDecodeError: If the file doesn't contain valid JSON.
+        _json.JSONDecodeError: If the file doesn't contain valid JSON.
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+            return _json.loads(file.read())
     except FileNotFoundError:
         raise FileNotFoundError(f"JSON file not found: {file_path}")
     except IOError as e:
         raise IOError(f"Error reading JSON file {file_path}: {str(e)}")
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {str(e)}", e.doc, e.pos)
+    except _json.JSONDecodeError as e:
+        raise _json.JSONDecodeError(f"Invalid JSON in file {file_path}: {str(e)}", e.doc, e.pos)
 
 
 def write_file(content: str, file_path: str) -> None:
@@ -129,7 +129,7 @@ def process_component(args: argparse.Namespace) -> int:
         result = processor.process_component(component_code, args.file)
         
         # Output the result
-        output_json = json.dumps(result, indent=2)
+        output_json = _json.dumps(result, indent=2)
         
         if args.output:
             write_file(output_json, args.output)
@@ -158,26 +158,21 @@ def convert_component(args: argparse.Namespace) -> int:
         
         # Convert the component
         converter = ShadcnToTypeScriptConverter()
-        ts_component, props_file, metadata = converter.convert(component_code)
+        result = converter.convert(component_code)
         
         # Determine output directory
         output_dir = args.output_dir if args.output_dir else os.path.dirname(args.file)
         
         # Determine file names
-        component_name = metadata.get("name", os.path.splitext(os.path.basename(args.file))[0])
-        component_file = metadata.get("file_name", f"{component_name}.tsx")
-        props_file_name = metadata.get("props_file_name", f"{component_name}.props.ts")
+        component_name = result.get("name") or os.path.splitext(os.path.basename(args.file))[0]
+        component_path = os.path.join(output_dir, f"{component_name}.tsx")
         
-        # Write the files
-        component_path = os.path.join(output_dir, component_file)
-        props_path = os.path.join(output_dir, props_file_name)
-        
-        write_file(ts_component, component_path)
-        write_file(props_file, props_path)
+        # Props are declared in the component file
+        write_file(result["component_ts_code"], component_path)
         
         logger.info(f"Component converted successfully:")
         logger.info(f"  - Component: {component_path}")
-        logger.info(f"  - Props: {props_path}")
+        logger.info(f"  - Props: {result.get('props', f'{component_name}Props')}")
         
         return 0
         
@@ -207,7 +202,7 @@ def generate_json_data(args: argparse.Namespace) -> int:
         )
         
         # Output the result
-        output_json = json.dumps(data, indent=2)
+        output_json = _json.dumps(data, indent=2)
         
         if args.output:
             write_file(output_json, args.output)
@@ -1,10 +1,10 @@
 """CLI for tag management operations."""
 
 import argparse
-import json
 import sys
 from typing import List, Dict, Any, Optional
 
+from .. import _json
 from ..tag_manager import TagManager
 from ..implementations.landing_tags import LandingPageTagFinder
 from ..logger import logger, setup_logger
@@ -58,7 +58,7 @@ def format_output(data: Any, output_format: str = "json") -> str:
         Formatted string.
     """
     if output_format == "json":
-        return json.dumps(data, indent=2)
+        return _json.dumps(data, indent=2)
     
     # Text format
     if isinstance(data, list):
@@ -69,6 +69,25 @@ def format_output(data: Any, output_format: str = "json") -> str:
         return str(data)
 
 
+def export_tag_data(output_format: str = "json") -> str:
+    """Serialize the built-in tag data for export.
+
+    Args:
+        output_format: Format to use ('json' or 'text').
+
+    Returns:
+        Formatted tag data.
+    """
+    from ..resources.tag_data import TAG_CATEGORIES, COMMON_COMPONENT_TAGS
+
+    export_data = {
+        "categories": TAG_CATEGORIES,
+        "components": COMMON_COMPONENT_TAGS
+    }
+
+    return format_output(export_data, output_format)
+
+
 def write_output(content: str, output_file: Optional[str] = None) -> None:
     """Write content to output file or stdout.
     
@@ -103,13 +122,13 @@ def load_components(components_input: str) -> List[Dict[str, Any]]:
     """
     try:
         # Try to parse as JSON string
-        return json.loads(components_input)
-    except json.JSONDecodeError:
+        return _json.loads(components_input)
+    except _json.JSONDecodeError:
         # Try to load as file
         try:
             with open(components_input, 'r') as f:
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
+                return _json.loads(f.read())
+        except (IOError, _json.JSONDecodeError) as e:
             raise ValueError(f"Failed to load components: {str(e)}")
 
 
@@ -149,14 +168,7 @@ def main() -> int:
             write_output(output)
             
         elif args.command == "export":
-            from ..resources.tag_data import TAG_CATEGORIES, COMMON_COMPONENT_TAGS
-            
-            export_data = {
-                "categories": {k: TAG_CATEGORIES[k] for k in TAG_CATEGORIES},
-                "components": COMMON_COMPONENT_TAGS
-            }
-            
-            output = format_output(export_data, args.format)
+            output = export_tag_data(args.format)
             write_output(output, args.output)
             
         elif args.command == "analyze":
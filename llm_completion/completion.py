@@ -1,12 +1,24 @@
 """Implementation of LiteLLM-based completion provider."""
 
-import json
+import hashlib
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, AsyncIterator
 import traceback
 
+import httpx
 import litellm
+from jsonschema.exceptions import SchemaError, UnknownType, best_match
+from jsonschema.validators import validator_for
+
+try:
+    from jsonschema.exceptions import _RefResolutionError
+    from referencing.exceptions import Unresolvable
+except ImportError:  # jsonschema < 4.18 resolves references itself
+    from jsonschema.exceptions import RefResolutionError as _RefResolutionError
+    Unresolvable = _RefResolutionError
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -15,7 +27,10 @@ from tenacity import (
     before_sleep_log,
 )
 
+from . import _json
+from .async_caller import AsyncCaller
 from .base import CompletionProvider
+from .cache import LLMCache, MemoryCache, make_cache_key
 from .config import config
 from .logger import logger
 from .exceptions import (
@@ -28,13 +43,112 @@ from .exceptions import (
 )
 
 
+JSON_INSTRUCTION = (
+    "You must respond with valid JSON only, no other text. "
+    "Ensure the response can be parsed as JSON."
+)
+
+
+@lru_cache(maxsize=32)
+def _json_system_prompt(system_prompt: Optional[str]) -> str:
+    """Append the JSON instruction to a system prompt.
+
+    Implementations reuse the same multi-KB system prompt on every call, so the
+    combined string is memoized rather than rebuilt per request.
+
+    Args:
+        system_prompt: Optional system instructions.
+
+    Returns:
+        The system prompt extended with the JSON instruction.
+    """
+    if system_prompt:
+        return f"{system_prompt}\n\n{JSON_INSTRUCTION}"
+    return JSON_INSTRUCTION
+
+
+@lru_cache(maxsize=32)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Derive a stable prompt cache routing key from a system prompt.
+
+    Args:
+        system_prompt: The static system prompt that prefixes the request.
+
+    Returns:
+        A short hex digest identifying the prompt prefix.
+    """
+    return hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _schema_validator(schema_json: str) -> Optional[Any]:
+    """Build a JSON schema validator, compiled once per distinct schema.
+
+    The schema is checked against its metaschema once here, so a schema
+    jsonschema cannot use disables validation instead of failing a completion
+    that has already been paid for.
+
+    Args:
+        schema_json: The schema serialized as JSON.
+
+    Returns:
+        A validator instance for the schema's declared draft, or None if the
+        schema is invalid.
+    """
+    schema = _json.loads(schema_json)
+    validator_cls = validator_for(schema)
+
+    try:
+        validator_cls.check_schema(schema)
+    except SchemaError as e:
+        logger.warning(f"Skipping response validation, invalid JSON schema: {e.message}")
+        return None
+
+    return validator_cls(schema)
+
+
 class LiteLLMCompletion(CompletionProvider):
     """LiteLLM-based completion provider with Gemini and OpenAI support."""
 
-    def __init__(self) -> None:
-        """Initialize the completion provider."""
+    # Lifetime of cached JSON responses, in seconds
+    CACHE_EXPIRE = 86400
+
+    def __init__(
+        self,
+        shared_session: Optional[httpx.AsyncClient] = None,
+        enable_cache: bool = False,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 6,
+        memory_cache_size: int = 1024,
+    ) -> None:
+        """Initialize the completion provider.
+
+        Args:
+            shared_session: Optional httpx client reused by all async requests
+                while the provider is entered as an async context manager. If not
+                provided, one is created on entry.
+            enable_cache: Whether to cache JSON completions on disk. Only requests
+                made with a temperature of 0 are cached.
+            max_concurrency: Maximum number of async requests in flight at once.
+                Defaults to the ``LLM_COMPLETION_MAX_PARALLEL`` environment
+                variable (32 if unset), so it can be tuned per provider tier.
+            max_retries: Maximum attempts per async request on transient errors.
+            memory_cache_size: Maximum number of deterministic JSON completions kept
+                in memory for the life of the provider. 0 disables the in-memory cache.
+        """
 
         self.providers = []
+        self._session = shared_session
+        self._owns_session = False
+        self._previous_session: Optional[httpx.AsyncClient] = None
+        self._session_installed = False
+        self.cache = LLMCache() if enable_cache else None
+        self.memory_cache = MemoryCache(memory_cache_size) if memory_cache_size else None
+        self.usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
+        self._caller = AsyncCaller(
+            max_concurrency=max_concurrency if max_concurrency is not None else config.max_parallel,
+            max_retries=max_retries,
+        )
         
         # Add Gemini if API key is available
         if config.gemini_api_key:
@@ -49,6 +163,37 @@ class LiteLLMCompletion(CompletionProvider):
         
         logger.info(f"Initialized LiteLLMCompletion with providers: {self.providers}")
 
+    async def __aenter__(self) -> "LiteLLMCompletion":
+        """Install a shared HTTP client for async requests, opening one if none was provided."""
+        if self._session is None:
+            self._session = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=300)
+            )
+            self._owns_session = True
+
+        # litellm takes its pooled async client from module state, not a per-call kwarg
+        if not self._session_installed:
+            self._previous_session = litellm.aclient_session
+            litellm.aclient_session = self._session
+            self._session_installed = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Uninstall the shared HTTP client and close it if it was opened by this provider."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Uninstall the shared HTTP client and close it if it was opened by this provider."""
+        if self._session_installed:
+            litellm.aclient_session = self._previous_session
+            self._previous_session = None
+            self._session_installed = False
+
+        if self._owns_session and self._session is not None:
+            await self._session.aclose()
+            self._session = None
+            self._owns_session = False
+
     @retry(
         retry=retry_if_exception_type((RateLimitError, LLMTimeoutError)),
         stop=stop_after_attempt(3),
@@ -80,11 +225,13 @@ class LiteLLMCompletion(CompletionProvider):
                 start_time = time.time()
                 messages = self._create_messages(prompt, system_prompt)
                 
-                provider_params = config.get_litellm_params(provider)
-                provider_params.update(kwargs)
+                provider_params = self._build_params(provider, system_prompt, kwargs)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Never log credentials
+                    logged_params = {k: v for k, v in provider_params.items() if k != "api_key"}
+                    logger.debug(f"Completion request: messages={messages} params={logged_params}")
 
-                print("messages:", messages)
-                print("provider_params:", provider_params)
                 response = litellm.completion(
                     messages=messages,
                     drop_params=True,
@@ -92,48 +239,227 @@ class LiteLLMCompletion(CompletionProvider):
                 )
                 
                 completion_text = response.choices[0].message.content
+                self._record_usage(provider, response)
                 
                 duration = time.time() - start_time
                 logger.info(f"Completion with {provider} successful ({duration:.2f}s)")
                 
                 return completion_text
                 
-            except litellm.exceptions.RateLimitError as e:
-                logger.warning(f"Rate limit exceeded with {provider}: {str(e)}")
-                errors.append(f"{provider} rate limit: {str(e)}")
-                raise RateLimitError(f"Rate limit exceeded with {provider}: {str(e)}")
+            except Exception as e:
+                self._handle_provider_error(provider, e, errors)
+        
+        # If we get here, all providers failed
+        error_msg = f"All providers failed: {'; '.join(errors)}"
+        logger.error(error_msg)
+        raise CompletionError(error_msg)
+
+    async def acomplete(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> str:
+        """Asynchronously generate text completion using LiteLLM with fallback support.
+
+        Requests are gated by the provider's concurrency limit and transient
+        errors are retried with jittered exponential backoff.
+
+        Args:
+            prompt: The user prompt to generate completion for.
+            system_prompt: Optional system instructions.
+            **kwargs: Additional parameters to pass to LiteLLM.
+
+        Returns:
+            The generated text completion.
+
+        Raises:
+            CompletionError: If all providers fail.
+        """
+        errors = []
+
+        for provider in self.providers:
+            try:
+                logger.info(f"Attempting async completion with {provider}")
                 
-            except litellm.exceptions.Timeout as e:
-                logger.warning(f"Timeout with {provider}: {str(e)}")
-                errors.append(f"{provider} timeout: {str(e)}")
-                raise LLMTimeoutError(f"Request to {provider} timed out: {str(e)}")
+                start_time = time.time()
+                messages = self._create_messages(prompt, system_prompt)
+                
+                provider_params = self._build_params(provider, system_prompt, kwargs)
+
+                response = await self._caller.call(
+                    litellm.acompletion,
+                    messages=messages,
+                    drop_params=True,
+                    **provider_params
+                )
                 
-            except litellm.exceptions.ServiceUnavailableError as e:
-                logger.warning(f"Service unavailable with {provider}: {str(e)}")
-                errors.append(f"{provider} unavailable: {str(e)}")
+                completion_text = response.choices[0].message.content
+                self._record_usage(provider, response)
                 
-            except litellm.exceptions.BadRequestError as e:
-                logger.error(f"Bad request with {provider}: {str(e)}")
-                errors.append(f"{provider} bad request: {str(e)}")
-                raise InvalidRequestError(f"Bad request to {provider}: {str(e)}")
+                duration = time.time() - start_time
+                logger.info(f"Async completion with {provider} successful ({duration:.2f}s)")
                 
-            except litellm.exceptions.AuthenticationError as e:
-                logger.error(f"Authentication error with {provider}: {str(e)}")
-                errors.append(f"{provider} auth error: {str(e)}")
-                raise APIKeyError(f"Authentication error with {provider}: {str(e)}")
+                return completion_text
                 
             except Exception as e:
-                logger.error(f"Unexpected error with {provider}: {str(e)}")
-                logger.error(traceback.format_exc())
-                errors.append(f"{provider} error: {str(e)}")
+                self._handle_provider_error(provider, e, errors)
         
         # If we get here, all providers failed
         error_msg = f"All providers failed: {'; '.join(errors)}"
         logger.error(error_msg)
         raise CompletionError(error_msg)
 
+    async def astream(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream a text completion token by token using LiteLLM.
+
+        Providers are tried in order until one accepts the request; once tokens
+        start arriving there is no further fallback.
+
+        Args:
+            prompt: The user prompt to generate completion for.
+            system_prompt: Optional system instructions.
+            **kwargs: Additional parameters to pass to LiteLLM.
+
+        Yields:
+            Chunks of the generated text as they arrive.
+
+        Raises:
+            CompletionError: If all providers fail or the stream is interrupted.
+        """
+        errors = []
+
+        for provider in self.providers:
+            try:
+                logger.info(f"Attempting streaming completion with {provider}")
+
+                messages = self._create_messages(prompt, system_prompt)
+
+                provider_params = self._build_params(provider, system_prompt, kwargs)
+
+                response = await self._caller.call(
+                    litellm.acompletion,
+                    messages=messages,
+                    drop_params=True,
+                    stream=True,
+                    **provider_params
+                )
+
+            except Exception as e:
+                self._handle_provider_error(provider, e, errors)
+                continue
+
+            try:
+                async for chunk in response:
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        yield content
+            except Exception as e:
+                error_msg = f"Streaming completion from {provider} failed: {str(e)}"
+                logger.error(error_msg)
+                raise CompletionError(error_msg)
+
+            return
+
+        # If we get here, all providers failed
+        error_msg = f"All providers failed: {'; '.join(errors)}"
+        logger.error(error_msg)
+        raise CompletionError(error_msg)
+
+    def _build_params(
+        self, provider: str, system_prompt: Optional[str], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the LiteLLM parameters for a request to a provider.
+
+        Args:
+            provider: The provider to send the request to.
+            system_prompt: Optional system instructions sent with the request.
+            kwargs: Additional parameters to pass to LiteLLM.
+
+        Returns:
+            The merged provider parameters.
+        """
+        provider_params = config.get_litellm_params(provider)
+        provider_params.update(kwargs)
+
+        # Requests sharing a static system prompt carry the same routing key so
+        # OpenAI serves them from the same prompt-prefix cache. Gemini caches
+        # repeated prefixes implicitly.
+        if provider == "openai" and system_prompt:
+            provider_params.setdefault("extra_body", {"prompt_cache_key": _prompt_cache_key(system_prompt)})
+
+        return provider_params
+
+    def _record_usage(self, provider: str, response: Any) -> None:
+        """Accumulate token usage reported by a completion response.
+
+        Args:
+            provider: The provider that served the response.
+            response: The LiteLLM completion response.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+
+        self.usage["prompt_tokens"] += getattr(usage, "prompt_tokens", None) or 0
+        self.usage["completion_tokens"] += getattr(usage, "completion_tokens", None) or 0
+        self.usage["cached_tokens"] += cached_tokens
+
+        if cached_tokens:
+            logger.info(f"{provider} served {cached_tokens} prompt tokens from its prompt cache")
+
+    def _handle_provider_error(self, provider: str, error: Exception, errors: List[str]) -> None:
+        """Map a LiteLLM error to a library exception or record it for fallback.
+
+        Args:
+            provider: The provider that raised the error.
+            error: The raised exception.
+            errors: Accumulated error messages; appended to in place.
+
+        Raises:
+            RateLimitError: If the provider's rate limit was exceeded.
+            LLMTimeoutError: If the request timed out.
+            InvalidRequestError: If the request was rejected as invalid.
+            APIKeyError: If authentication failed.
+        """
+        if isinstance(error, litellm.exceptions.RateLimitError):
+            logger.warning(f"Rate limit exceeded with {provider}: {str(error)}")
+            errors.append(f"{provider} rate limit: {str(error)}")
+            raise RateLimitError(f"Rate limit exceeded with {provider}: {str(error)}")
+
+        elif isinstance(error, litellm.exceptions.Timeout):
+            logger.warning(f"Timeout with {provider}: {str(error)}")
+            errors.append(f"{provider} timeout: {str(error)}")
+            raise LLMTimeoutError(f"Request to {provider} timed out: {str(error)}")
+
+        elif isinstance(error, litellm.exceptions.ServiceUnavailableError):
+            logger.warning(f"Service unavailable with {provider}: {str(error)}")
+            errors.append(f"{provider} unavailable: {str(error)}")
+
+        elif isinstance(error, litellm.exceptions.BadRequestError):
+            logger.error(f"Bad request with {provider}: {str(error)}")
+            errors.append(f"{provider} bad request: {str(error)}")
+            raise InvalidRequestError(f"Bad request to {provider}: {str(error)}")
+
+        elif isinstance(error, litellm.exceptions.AuthenticationError):
+            logger.error(f"Authentication error with {provider}: {str(error)}")
+            errors.append(f"{provider} auth error: {str(error)}")
+            raise APIKeyError(f"Authentication error with {provider}: {str(error)}")
+
+        else:
+            logger.error(f"Unexpected error with {provider}: {str(error)}")
+            logger.error(traceback.format_exc())
+            errors.append(f"{provider} error: {str(error)}")
+
     def complete_with_json(
-        self, prompt: str, system_prompt: Optional[str] = None, json_schema: Optional[Dict[str, Any]] = None, **kwargs: Any
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        **kwargs: Any
     ) -> Dict[str, Any]:
         """Generate JSON completion using LiteLLM with fallback support.
 
@@ -141,6 +467,64 @@ class LiteLLMCompletion(CompletionProvider):
             prompt: The user prompt to generate completion for.
             system_prompt: Optional system instructions.
             json_schema: Optional JSON schema to validate the response format.
+            use_cache: Whether to serve and store deterministic (temperature 0)
+                responses through the response caches.
+            **kwargs: Additional parameters to pass to LiteLLM.
+
+        Returns:
+            The generated completion as a JSON object.
+
+        Raises:
+            CompletionError: If all providers fail or if the response is not valid JSON.
+        """
+        json_system_prompt = self._prepare_json_request(system_prompt, json_schema, kwargs)
+
+        # Serialized once per request for both the cache key and validation
+        schema_json = _json.dumps(json_schema) if json_schema else None
+
+        cache_key = self._get_cache_key(prompt, json_system_prompt, schema_json, kwargs) if use_cache else None
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached JSON completion")
+                return cached
+
+        # Get completion with enhanced JSON instruction
+        try:
+            result = self.complete(prompt, json_system_prompt, **kwargs)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"JSON completion result: {result}")
+
+            parsed = self._parse_json_response(result)
+            self._validate_json_response(parsed, schema_json)
+            if cache_key is not None:
+                self._cache_set(cache_key, parsed)
+
+            return parsed
+                
+        except Exception as e:
+            if isinstance(e, CompletionError):
+                raise
+            error_msg = f"Error getting JSON completion: {str(e)}"
+            logger.error(error_msg)
+            raise CompletionError(error_msg)
+
+    async def acomplete_with_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Asynchronously generate JSON completion using LiteLLM with fallback support.
+
+        Args:
+            prompt: The user prompt to generate completion for.
+            system_prompt: Optional system instructions.
+            json_schema: Optional JSON schema to validate the response format.
+            use_cache: Whether to serve and store deterministic (temperature 0)
+                responses through the response caches.
             **kwargs: Additional parameters to pass to LiteLLM.
 
         Returns:
@@ -149,14 +533,50 @@ class LiteLLMCompletion(CompletionProvider):
         Raises:
             CompletionError: If all providers fail or if the response is not valid JSON.
         """
+        json_system_prompt = self._prepare_json_request(system_prompt, json_schema, kwargs)
+
+        # Serialized once per request for both the cache key and validation
+        schema_json = _json.dumps(json_schema) if json_schema else None
+
+        cache_key = self._get_cache_key(prompt, json_system_prompt, schema_json, kwargs) if use_cache else None
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached JSON completion")
+                return cached
+
+        try:
+            result = await self.acomplete(prompt, json_system_prompt, **kwargs)
+
+            parsed = self._parse_json_response(result)
+            self._validate_json_response(parsed, schema_json)
+            if cache_key is not None:
+                self._cache_set(cache_key, parsed)
+
+            return parsed
+
+        except Exception as e:
+            if isinstance(e, CompletionError):
+                raise
+            error_msg = f"Error getting JSON completion: {str(e)}"
+            logger.error(error_msg)
+            raise CompletionError(error_msg)
+
+    def _prepare_json_request(
+        self, system_prompt: Optional[str], json_schema: Optional[Dict[str, Any]], kwargs: Dict[str, Any]
+    ) -> str:
+        """Build the JSON system prompt and set the response format.
+
+        Args:
+            system_prompt: Optional system instructions.
+            json_schema: Optional JSON schema to enforce on the response.
+            kwargs: LiteLLM parameters; ``response_format`` is set in place.
+
+        Returns:
+            The system prompt extended with JSON instructions.
+        """
         # Add JSON instruction to system prompt
-        json_system_prompt = (
-            "You must respond with valid JSON only, no other text. "
-            "Ensure the response can be parsed as JSON."
-        )
-        
-        if system_prompt:
-            json_system_prompt = f"{system_prompt}\n\n{json_system_prompt}"
+        json_system_prompt = _json_system_prompt(system_prompt)
             
         # Set up response format for JSON schema if provided
         if json_schema:
@@ -168,39 +588,155 @@ class LiteLLMCompletion(CompletionProvider):
                     "strict": False
                 },
             }
+        else:
+            # Without a schema, still ask for JSON mode so the provider
+            # returns bare JSON rather than prose or a fenced block
+            kwargs.setdefault("response_format", {"type": "json_object"})
 
-        # Get completion with enhanced JSON instruction
-        try:
-            print("json_system_prompt:", json_system_prompt)
-            print("prompt:", prompt)
-            print("kwargs:", kwargs)
-            result = self.complete(prompt, json_system_prompt, **kwargs)
-            print("result:", result)
-
-            # Try to extract JSON from the response if it contains markdown code block
-            if "```json" in result:
-                try:
-                    # Extract content from json code block
-                    json_content = result.split("```json")[1].split("```")[0].strip()
-                    return json.loads(json_content)
-                except (IndexError, json.JSONDecodeError):
-                    pass
-                    
-            # Direct parsing if no code block or extraction failed
+        return json_system_prompt
+
+    def _get_cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        schema_json: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Get the response cache key for a request, if it is cacheable.
+
+        Only deterministic requests (temperature 0) are cached.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: The system instructions sent with the prompt.
+            schema_json: Optional serialized JSON schema the response must follow.
+            kwargs: Additional LiteLLM parameters for the request.
+
+        Returns:
+            The cache key, or None if caching does not apply.
+        """
+        if self.cache is None and self.memory_cache is None:
+            return None
+
+        temperature = kwargs.get("temperature", config.temperature)
+        if temperature != 0:
+            return None
+
+        models = [config.get_litellm_params(provider)["model"] for provider in self.providers]
+        messages = self._create_messages(prompt, system_prompt)
+
+        return make_cache_key(models, messages, temperature, schema_json)
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Look up a response in memory, then on disk.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response, or None if neither cache has it.
+        """
+        if self.memory_cache is not None:
+            cached = self.memory_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                # Promote disk hits so repeats skip SQLite
+                if self.memory_cache is not None:
+                    self.memory_cache.set(key, cached)
+                return cached
+
+        return None
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """Store a response in every enabled cache.
+
+        Args:
+            key: The cache key.
+            value: The parsed JSON response.
+        """
+        if self.memory_cache is not None:
+            self.memory_cache.set(key, value)
+        if self.cache is not None:
+            self.cache.set(key, value, expire=self.CACHE_EXPIRE)
+
+    def _parse_json_response(self, result: str) -> Dict[str, Any]:
+        """Parse a completion as JSON, unwrapping a markdown code block if present.
+
+        Args:
+            result: The raw completion text.
+
+        Returns:
+            The parsed JSON object.
+
+        Raises:
+            CompletionError: If the response is not valid JSON.
+        """
+        # JSON mode and structured output return bare JSON; parse it without
+        # scanning for a code fence (which could also match inside its strings)
+        stripped = result.strip()
+        if stripped[:1] in ("{", "["):
             try:
-                return json.loads(result)
-            except json.JSONDecodeError as e:
-                error_msg = f"Failed to parse response as JSON: {str(e)}\nResponse: {result}"
-                logger.error(error_msg)
-                raise CompletionError(error_msg)
+                return _json.loads(stripped)
+            except _json.JSONDecodeError:
+                pass
+
+        # Try to extract JSON from the response if it contains markdown code block.
+        # Two linear scans; an unterminated block runs to the end of the response.
+        start = result.find("```json")
+        if start != -1:
+            start += len("```json")
+            end = result.find("```", start)
+            try:
+                # Extract content from json code block
+                return _json.loads(result[start:end if end != -1 else None].strip())
+            except _json.JSONDecodeError:
+                pass
                 
-        except Exception as e:
-            if isinstance(e, CompletionError):
-                raise
-            error_msg = f"Error getting JSON completion: {str(e)}"
+        # Direct parsing if no code block or extraction failed
+        try:
+            return _json.loads(result)
+        except _json.JSONDecodeError as e:
+            error_msg = f"Failed to parse response as JSON: {str(e)}\nResponse: {result}"
             logger.error(error_msg)
             raise CompletionError(error_msg)
 
+    def _validate_json_response(self, data: Any, schema_json: Optional[str]) -> None:
+        """Check a parsed response against the requested schema.
+
+        Providers are asked for the schema non-strictly, so a mismatch is
+        logged rather than raised.
+
+        Args:
+            data: The parsed JSON response.
+            schema_json: Optional serialized JSON schema the response should follow.
+        """
+        if not schema_json:
+            return
+
+        validator = _schema_validator(schema_json)
+        if validator is None:
+            return
+
+        try:
+            if validator.is_valid(data):
+                return
+
+            # Errors are only collected for invalid responses; report the most relevant
+            error = best_match(validator.iter_errors(data))
+        except UnknownType as e:
+            logger.warning(f"Skipping response validation, unsupported JSON schema: {e}")
+            return
+        except (Unresolvable, _RefResolutionError) as e:
+            logger.warning(f"Skipping response validation, unresolvable JSON schema reference: {e}")
+            return
+
+        location = "/".join(str(part) for part in error.absolute_path) or "<root>"
+        logger.warning(f"JSON completion does not match the requested schema at {location}: {error.message}")
+
     def _create_messages(
         self, prompt: str, system_prompt: Optional[str] = None
     ) -> List[Dict[str, str]]:
@@ -220,4 +756,30 @@ class LiteLLMCompletion(CompletionProvider):
             
         messages.append({"role": "user", "content": prompt})
         
-        return messages
\ No newline at end of file
+        return messages
+
+
+_default_completion: Optional[LiteLLMCompletion] = None
+_default_completion_lock = threading.Lock()
+
+
+def get_default_completion() -> LiteLLMCompletion:
+    """Get the process-wide default completion provider, creating it on first use.
+
+    Implementations built without an explicit provider share this instance, so
+    they also share its response caches, usage counters and concurrency limit.
+
+    Returns:
+        The shared completion provider.
+
+    Raises:
+        APIKeyError: If no provider API key is configured.
+    """
+    global _default_completion
+
+    if _default_completion is None:
+        with _default_completion_lock:
+            if _default_completion is None:
+                _default_completion = LiteLLMCompletion()
+
+    return _default_completion
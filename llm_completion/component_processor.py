@@ -1,17 +1,79 @@
 """Component processor for shadcn components."""
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional
 import os
-import json
 import re
 
-from .completion import LiteLLMCompletion
+from .completion import LiteLLMCompletion, get_default_completion
 from .logger import logger
-from .utils import extract_code_from_markdown
 from .tag_manager import TagManager
 from .implementations.shadcn_to_ts import ShadcnToTypeScriptConverter
 
 
+# Separators in kebab-case and snake_case file names
+_NAME_SEPARATOR_RE = re.compile(r"[-_]")
+
+# Component declaration in source code
+_COMPONENT_NAME_RE = re.compile(r"(?:export\s+)?(?:const|function|class)\s+([A-Z][a-zA-Z0-9]+)")
+
+# Fallback pattern for common icon imports and usages, matched in one pass:
+# named *Icon imports, react-icons imports, and *Icon JSX elements
+_ICON_RE = re.compile(
+    r"import\s+{\s*(?P<icon_import>[A-Z][a-zA-Z0-9]*Icon[a-zA-Z0-9]*)\s*}\s*from\s*['\"](?P<icon_package>[^'\"]+)['\"]"
+    r"|import\s+{\s*(?P<react_icon>[A-Z][a-zA-Z0-9]*)\s*}\s*from\s*['\"]react-icons/(?P<react_icon_package>[^'\"]+)['\"]"
+    r"|<(?P<jsx_icon>[A-Z][a-zA-Z0-9]*Icon[a-zA-Z0-9]*)\s*"
+)
+
+# react-icons packages keyed by their two-letter icon name prefix
+_ICON_PACKAGES = {
+    "Fa": "react-icons/fa",
+    "Md": "react-icons/md",
+    "Io": "react-icons/io",
+    "Bi": "react-icons/bi",
+    "Fi": "react-icons/fi",
+}
+
+
+# Tagging instructions for components without known tags; kept constant so
+# they form a cacheable prompt prefix
+_TAG_ANALYSIS_INSTRUCTIONS = (
+    "Analyze the following React component code and identify the most appropriate "
+    "tags for it. Return a JSON object with 'primary_tag' and 'additional_tags' keys. "
+    "The primary tag should be one of the following structural tags:\n"
+    "hero, header, footer, navigation, cta, testimonials, features, pricing, faq, "
+    "contact, team, stats, newsletter, banner, gallery, partners, showcase, process\n\n"
+    "Additional tags should be selected from the following categories:\n"
+    "- Function: action-trigger, data-display, content-container, form-element, feedback, "
+    "navigation-element, social-proof, disclosure, media-display, state-indicator\n"
+    "- Content: text-heavy, visual-dominant, icon-based, form, interactive-element, "
+    "data-visualization, mixed-media\n"
+    "- Style: minimalist, bold, dark-mode, gradient, glassmorphism, neumorphic, "
+    "skeuomorphic, flat-design, animated, gradient-border, shadow-heavy, rounded\n"
+    "- Technical: responsive-mobile, responsive-desktop, interactive, static, "
+    "dynamic-content, lazy-loaded, fixed-position, sticky-element"
+)
+
+# User prompt template; only the component varies per request
+_TAG_ANALYSIS_PROMPT_TMPL = "Component name: {name}\n\nComponent code:\n{code}"
+
+# Schema for the code analysis response
+_TAG_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "primary_tag": {"type": "string"},
+        "additional_tags": {
+            "type": "array",
+            "items": {"type": "string"}
+        },
+        "complexity": {"type": "string", "enum": ["simple", "medium", "complex"]},
+        "features": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    },
+    "required": ["primary_tag"]
+}
+
 class ComponentProcessor:
     """Processor for shadcn components with TypeScript conversion and tagging."""
 
@@ -20,11 +82,12 @@ class ComponentProcessor:
 
         Args:
             completion_provider: Optional completion provider to use. If not provided,
-                a new instance will be created.
+                the shared default provider is used.
         """
-        self.converter = ShadcnToTypeScriptConverter(completion_provider)
+        # Share one provider between the converter and the processor's own calls
+        self.completion_provider = completion_provider or get_default_completion()
+        self.converter = ShadcnToTypeScriptConverter(self.completion_provider)
         self.tag_manager = TagManager()
-        self.completion_provider = completion_provider or LiteLLMCompletion()
 
     def process_component(self, component_code: str, file_path: str) -> Dict[str, Any]:
         """Process a shadcn component: convert to TypeScript, extract icons, and tag it.
@@ -44,12 +107,13 @@ class ComponentProcessor:
         
         try:
             # 1. Convert to TypeScript
-            ts_component, props_file, metadata = self.converter.convert(component_code)
+            converted = self.converter.convert(component_code)
+            ts_component = converted["component_ts_code"]
             
             # 2. Extract component name and props info
-            component_name = metadata.get("name", self._extract_component_name(file_path, component_code))
-            props_name = metadata.get("props", f"{component_name}Props")
-            props_file_name = metadata.get("props_file_name", f"{self._get_base_filename(file_path)}.props.ts")
+            component_name = converted.get("name") or self._extract_component_name(file_path, component_code)
+            props_name = converted.get("props") or f"{component_name}Props"
+            component_file_name = f"{self._get_base_filename(file_path)}.tsx"
             
             # 3. Extract icons from component code
             icons = self._extract_icons(component_code, ts_component)
@@ -62,12 +126,12 @@ class ComponentProcessor:
                 "component": {
                     "name": component_name,
                     "typescript_code": ts_component,
-                    "file_name": f"{self._get_base_filename(file_path)}.tsx"
+                    "file_name": component_file_name
                 },
+                # Props are declared alongside the component
                 "props": {
                     "name": props_name,
-                    "code": props_file,
-                    "file_name": props_file_name
+                    "file_name": component_file_name
                 },
                 "icons": icons,
                 "tags": component_tags,
@@ -97,13 +161,12 @@ class ComponentProcessor:
         
         # Convert kebab-case or snake_case to PascalCase
         if "-" in file_name or "_" in file_name:
-            parts = re.split(r"[-_]", file_name)
+            parts = _NAME_SEPARATOR_RE.split(file_name)
             pascal_name = "".join(part.capitalize() for part in parts)
             return pascal_name
             
         # Try to extract from code using regex
-        pattern = r"(?:export\s+)?(?:const|function|class)\s+([A-Z][a-zA-Z0-9]+)"
-        match = re.search(pattern, component_code)
+        match = _COMPONENT_NAME_RE.search(component_code)
         if match:
             return match.group(1)
             
@@ -164,60 +227,42 @@ class ComponentProcessor:
             # Use JSON completion to directly get structured data
             result = self.completion_provider.complete_with_json(prompt, system_prompt, json_schema=schema)
             
+            # Sometimes the API returns a wrapper object; take its first list
+            if isinstance(result, dict):
+                result = next((value for value in result.values() if isinstance(value, list)), result)
+
             # Ensure result is a list
-            if isinstance(result, list):
-                # Validate each item has required fields
-                validated_icons = []
-                for icon in result:
-                    if isinstance(icon, dict) and "package" in icon and "name" in icon:
-                        validated_icons.append({
-                            "package": icon["package"],
-                            "name": icon["name"]
-                        })
-                return validated_icons
-            elif isinstance(result, dict) and "icons" in result and isinstance(result["icons"], list):
-                # Sometimes the API returns a wrapper object
-                return result["icons"]
-            else:
+            if not isinstance(result, list):
                 logger.warning(f"Unexpected icon extraction result format: {type(result)}")
                 return []
+
+            # Validate each item has required fields
+            return [
+                {"package": icon["package"], "name": icon["name"]}
+                for icon in result
+                if isinstance(icon, dict) and "package" in icon and "name" in icon
+            ]
                 
         except Exception as e:
             logger.error(f"Error extracting icons: {str(e)}")
             
             # Fallback to regex pattern matching for common icon patterns
-            icon_patterns = [
-                r"import\s+{\s*([A-Z][a-zA-Z0-9]*Icon[a-zA-Z0-9]*)\s*}\s*from\s*['\"]([^'\"]+)['\"]",
-                r"import\s+{\s*([A-Z][a-zA-Z0-9]*)\s*}\s*from\s*['\"]react-icons/([^'\"]+)['\"]",
-                r"<([A-Z][a-zA-Z0-9]*Icon[a-zA-Z0-9]*)\s*",
-            ]
-            
+            code = original_code + "\n" + typescript_code
             icons = []
-            for pattern in icon_patterns:
-                matches = re.findall(pattern, original_code + "\n" + typescript_code)
-                for match in matches:
-                    if isinstance(match, tuple) and len(match) >= 2:
-                        icons.append({
-                            "name": match[0],
-                            "package": match[1]
-                        })
-                    elif isinstance(match, str):
-                        # Just the icon name, try to guess the package
-                        if match.startswith("Fa"):
-                            package = "react-icons/fa"
-                        elif match.startswith("Md"):
-                            package = "react-icons/md"
-                        elif match.startswith("Io"):
-                            package = "react-icons/io"
-                        elif match.startswith("Bi"):
-                            package = "react-icons/bi"
-                        else:
-                            package = "unknown"
-                        
-                        icons.append({
-                            "name": match,
-                            "package": package
-                        })
+            for match in _ICON_RE.finditer(code):
+                if match.group("icon_import"):
+                    name, package = match.group("icon_import", "icon_package")
+                elif match.group("react_icon"):
+                    name, package = match.group("react_icon", "react_icon_package")
+                else:
+                    # Just the icon name, try to guess the package
+                    name = match.group("jsx_icon")
+                    package = _ICON_PACKAGES.get(name[:2], "unknown")
+
+                icons.append({
+                    "name": name,
+                    "package": package
+                })
             
             return icons
 
@@ -242,45 +287,14 @@ class ComponentProcessor:
             # If no tags were found, analyze the code to infer tags
             if not component_tags:
                 # Use a smart approach to infer tags from the code
-                code_analysis_prompt = (
-                    "Analyze the following React component code and identify the most appropriate "
-                    "tags for it. Return a JSON object with 'primary_tag' and 'additional_tags' keys. "
-                    "The primary tag should be one of the following structural tags:\n"
-                    "hero, header, footer, navigation, cta, testimonials, features, pricing, faq, "
-                    "contact, team, stats, newsletter, banner, gallery, partners, showcase, process\n\n"
-                    "Additional tags should be selected from the following categories:\n"
-                    "- Function: action-trigger, data-display, content-container, form-element, feedback, "
-                    "navigation-element, social-proof, disclosure, media-display, state-indicator\n"
-                    "- Content: text-heavy, visual-dominant, icon-based, form, interactive-element, "
-                    "data-visualization, mixed-media\n"
-                    "- Style: minimalist, bold, dark-mode, gradient, glassmorphism, neumorphic, "
-                    "skeuomorphic, flat-design, animated, gradient-border, shadow-heavy, rounded\n"
-                    "- Technical: responsive-mobile, responsive-desktop, interactive, static, "
-                    "dynamic-content, lazy-loaded, fixed-position, sticky-element\n\n"
-                    f"Component name: {component_name}\n\n"
-                    f"Component code:\n{typescript_code}"
+                code_analysis_prompt = _TAG_ANALYSIS_PROMPT_TMPL.format(
+                    name=component_name, code=typescript_code
                 )
                 
                 try:
-                    # Define schema for code analysis
-                    analysis_schema = {
-                        "type": "object",
-                        "properties": {
-                            "primary_tag": {"type": "string"},
-                            "additional_tags": {
-                                "type": "array",
-                                "items": {"type": "string"}
-                            },
-                            "complexity": {"type": "string", "enum": ["simple", "medium", "complex"]},
-                            "features": {
-                                "type": "array", 
-                                "items": {"type": "string"}
-                            }
-                        },
-                        "required": ["primary_tag"]
-                    }
-                    
-                    code_analysis = self.completion_provider.complete_with_json(code_analysis_prompt, json_schema=analysis_schema)
+                    code_analysis = self.completion_provider.complete_with_json(
+                        code_analysis_prompt, _TAG_ANALYSIS_INSTRUCTIONS, json_schema=_TAG_ANALYSIS_SCHEMA
+                    )
                     
                     if isinstance(code_analysis, dict):
                         primary_tag = code_analysis.get("primary_tag", "")
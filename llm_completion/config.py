@@ -29,6 +29,7 @@ class Config:
         # General settings
         self.max_tokens = int(os.getenv("MAX_TOKENS", "4096"))
         self.temperature = float(os.getenv("TEMPERATURE", "0.7"))
+        self.max_parallel = int(os.getenv("LLM_COMPLETION_MAX_PARALLEL", "32"))
 
     def _check_required_env_vars(self) -> None:
         """Check that required environment variables are set.
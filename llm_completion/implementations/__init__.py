@@ -1,11 +1,32 @@
 """Specific implementations of the LLM completion interface."""
 
-from .shadcn_to_ts import ShadcnToTypeScriptConverter
-from .landing_tags import LandingPageTagFinder
-from .json_generator import JsonSchemaDataGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .shadcn_to_ts import ShadcnToTypeScriptConverter
+    from .landing_tags import LandingPageTagFinder
+    from .json_generator import JsonSchemaDataGenerator
+
+# Implementations are imported on first access
+_LAZY_EXPORTS = {
+    "ShadcnToTypeScriptConverter": ".shadcn_to_ts",
+    "LandingPageTagFinder": ".landing_tags",
+    "JsonSchemaDataGenerator": ".json_generator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import implementations on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ShadcnToTypeScriptConverter",
     "LandingPageTagFinder",
     "JsonSchemaDataGenerator",
-]
\ No newline at end of file
+]
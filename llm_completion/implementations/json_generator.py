@@ -1,46 +1,150 @@
 """Implementation for generating data in JSON format based on schemas."""
 
-from typing import Dict, List, Any, Optional, Union
-import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union
+import logging
 
-from ..completion import LiteLLMCompletion
+from .. import _json
 from ..logger import logger
 
-def merge_schemas(schemas: dict) -> dict:
+if TYPE_CHECKING:
+    from ..completion import LiteLLMCompletion
+
+
+@lru_cache(maxsize=1024)
+def _pascal_case_icon(icon_name: str) -> str:
+    """Convert a hyphenated lucide icon name to PascalCase.
+
+    Generated payloads reuse a small vocabulary of icon names, so conversions
+    are memoized.
+
+    Args:
+        icon_name: Icon name such as ``"check-circle"``.
+
+    Returns:
+        The PascalCase name, e.g. ``"CheckCircle"``.
     """
-    Combines a list of JSON schemas into a single schema using the 'allOf' keyword.
+    return ''.join(x.title() for x in icon_name.split('-'))
+
 
-    This is the most robust and recommended method for combining schemas, as it
-    preserves the validation rules of each individual schema.
+# Keywords whose value is a single subschema, a list of them, or a mapping to them
+_SUBSCHEMA_KEYWORDS = ("items", "additionalProperties", "additionalItems", "contains", "if", "then", "else")
+_SUBSCHEMA_LIST_KEYWORDS = ("items", "prefixItems", "allOf", "anyOf", "oneOf")
+_SUBSCHEMA_MAP_KEYWORDS = ("properties", "patternProperties")
+
+
+def _is_property_map(schema: Any) -> bool:
+    """Check whether a schema is a bare map of property names to subschemas.
+
+    Callers often pass the ``properties`` of an object (e.g.
+    ``{"title": {"type": "string"}}``) rather than a full object schema.
 
     Args:
-        schemas: A list of dictionaries, where each dictionary is a JSON schema.
+        schema: The parsed schema.
 
     Returns:
-        A new dictionary representing the combined JSON schema.
+        True if every value is a subschema and ``type`` is not a schema type.
     """
-    merged_schema = {
-        "type": "object",
-        "properties": schemas,
-        "additionalProperties": False
-    }
-    
-    return merged_schema
+    if not isinstance(schema, dict) or not schema:
+        return False
+    if isinstance(schema.get("type"), (str, list)):
+        return False
+    return all(isinstance(value, dict) for value in schema.values())
+
+
+@lru_cache(maxsize=64)
+def _schema_may_contain_icons(schema_json: str) -> bool:
+    """Check whether data matching a schema can hold lucide icon objects.
+
+    Icons are objects with ``package``/``type``/``name`` keys. Anything that
+    may be an object and is not closed to a ``package`` key can hold one:
+    untyped subschemas, objects declaring ``package``, and objects whose
+    ``additionalProperties`` is omitted or not False. References are not
+    resolved and are assumed to allow icons. For a bare property map only
+    the property subschemas are checked.
+
+    Args:
+        schema_json: The schema serialized as JSON.
+
+    Returns:
+        False if the schema rules out icon objects, True otherwise.
+    """
+    schema = _json.loads(schema_json)
+    stack = list(schema.values()) if _is_property_map(schema) else [schema]
+    while stack:
+        node = stack.pop()
+
+        if node is True:
+            return True
+        if not isinstance(node, dict):
+            continue
+        if "$ref" in node:
+            return True
+
+        types = node.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is None or "object" in types:
+            properties = node.get("properties")
+            if isinstance(properties, dict) and "package" in properties:
+                return True
+            if node.get("additionalProperties", True) is not False or "patternProperties" in node:
+                return True
+
+        for keyword in _SUBSCHEMA_KEYWORDS:
+            value = node.get(keyword)
+            if isinstance(value, (dict, bool)):
+                stack.append(value)
+        for keyword in _SUBSCHEMA_LIST_KEYWORDS:
+            value = node.get(keyword)
+            if isinstance(value, list):
+                stack.extend(value)
+        for keyword in _SUBSCHEMA_MAP_KEYWORDS:
+            value = node.get(keyword)
+            if isinstance(value, dict):
+                stack.extend(value.values())
+
+    return False
+
+
+# Generation instructions; kept constant so they form a cacheable prompt prefix
+_GENERATION_INSTRUCTIONS = (
+    "Don't fill Background image & Background color unless asked for it.\n"
+    "We are generating data for Landing pages so repeat minimally only if required.\n"
+    "Fill image assets with Unsplash/Pexels/Pixabay stock images you know exist.\n"
+    "Only use known icons from `lucide-react`.\n\n"
+    "Return ONLY valid JSON data that matches the schema(s) provided."
+)
+
+# User prompt templates; only the request details vary per call
+_PROMPT_TMPL = "Generate {num_examples} {noun} of JSON data.\nAdditional requirements: \n{user_prompt}"
+_ITEMS_PROMPT_TMPL = "\nReturn exactly {num_examples} items in the \"items\" array."
+
 
 class JsonSchemaDataGenerator:
     """Generator for JSON data based on schemas."""
 
-    def __init__(self, completion_provider: Optional[LiteLLMCompletion] = None) -> None:
+    __slots__ = ("completion_provider", "system_prompt")
+
+    def __init__(self, completion_provider: Optional["LiteLLMCompletion"] = None) -> None:
         """Initialize the JSON generator.
 
         Args:
             completion_provider: Optional completion provider to use. If not provided,
-                a new instance will be created.
+                the shared default provider is used.
         """
-        self.completion_provider = completion_provider or LiteLLMCompletion()
+        if completion_provider is None:
+            # Deferred so importing the module does not load litellm
+            from ..completion import get_default_completion
+
+            completion_provider = get_default_completion()
+        self.completion_provider = completion_provider
         self.system_prompt = (
             "You are an expert Website Copywriter specializing in creating realistic"
-            " JSON data that conforms to specific schemas."
+            " JSON data that conforms to specific schemas.\n\n"
+            + _GENERATION_INSTRUCTIONS
         )
 
     def generate_data(
@@ -48,7 +152,7 @@ class JsonSchemaDataGenerator:
         schemas: Dict[str, Any], 
         user_prompt: str,
         num_examples: int = 1
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Generate JSON data based on provided schemas.
 
         Args:
@@ -57,91 +161,250 @@ class JsonSchemaDataGenerator:
             num_examples: Number of examples to generate.
 
         Returns:
-            A single JSON data object with predefined keys from the schema.
+            A single JSON data object with predefined keys from the schema, or a
+            list of ``num_examples`` such objects when more than one is requested.
 
         Raises:
             Exception: If data generation fails.
         """
         logger.info(f"Generating data for {len(schemas.keys())} schemas")
 
-        # icons = {
-        #     "type": "array",
-        #     "items": {
-        #         "type": "string"
-        #     }
-        # }
-
-        # schemas["icons"] = icons
-
-        # merged_schema = merge_schemas(schemas)
-        # print("merged_schema:", merged_schema)
-
-        
-        prompt = (
-            f"Generate {num_examples} examples of JSON data"
-            f"Additional requirements: \n{user_prompt}\n\n"
-            "Don't fill Background image & Background color unless asked for it.\n"
-            "We are generating data for Landing pages so repeat minimally only if required.\n"
-            "Fill image assets with Unsplash/Pexels/Pixabay stock images you know exist.\n"
-            "Only use known icons from `lucide-react`.\n\n"
-            # "icons will contain all the icons used in the JSON data."
-            "Return ONLY valid JSON data that matches the schema(s) provided."
-        )
+        prompt = self._build_prompt(user_prompt, num_examples)
+        json_schema = self._build_schema(schemas, num_examples)
 
         try:
-            # Define JSON schema for the response
-            print("prompt:", prompt)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Data generation prompt: {prompt}")
 
-            result = self.completion_provider.complete_with_json(prompt, self.system_prompt, json_schema=schemas)
-            print("Generated JSON data:", result)
+            result = self.completion_provider.complete_with_json(prompt, self.system_prompt, json_schema=json_schema)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Generated JSON data: {result}")
             
             # Process the data to ensure all image and icon fields are properly formatted
-            processed_result = self._process_generated_data(result)
+            processed_result = self._process_generated_data(result, json_schema)
             
             logger.info("Successfully generated data")
 
-            return processed_result
+            return self._unwrap_examples(processed_result, num_examples)
 
         except Exception as e:
             logger.error(f"Failed to generate JSON data: {str(e)}")
             raise
+
+    def generate_data_batch(
+        self,
+        schemas_list: List[Dict[str, Any]],
+        user_prompt: str,
+        num_examples: int = 1,
+        max_workers: int = 8
+    ) -> List[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Generate JSON data for several schemas concurrently.
+
+        Each schema is an independent, I/O-bound completion, so requests are
+        issued from a thread pool rather than one after another.
+
+        Args:
+            schemas_list: JSON schemas to generate data for.
+            user_prompt: Additional instructions for data generation.
+            num_examples: Number of examples to generate per schema.
+            max_workers: Maximum number of requests in flight at once.
+
+        Returns:
+            The generated data for each schema, in the order given.
+
+        Raises:
+            Exception: If data generation fails for any schema.
+        """
+        if not schemas_list:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(schemas_list))) as executor:
+            return list(executor.map(
+                lambda schemas: self.generate_data(schemas, user_prompt, num_examples),
+                schemas_list,
+            ))
+
+    async def agenerate_data(
+        self, 
+        schemas: Dict[str, Any], 
+        user_prompt: str,
+        num_examples: int = 1
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Asynchronously generate JSON data based on provided schemas.
+
+        Args:
+            schemas: JSON schema or list of schemas.
+            user_prompt: Additional instructions for data generation.
+            num_examples: Number of examples to generate.
+
+        Returns:
+            A single JSON data object with predefined keys from the schema, or a
+            list of ``num_examples`` such objects when more than one is requested.
+
+        Raises:
+            Exception: If data generation fails.
+        """
+        logger.info(f"Generating data for {len(schemas.keys())} schemas (async)")
+
+        prompt = self._build_prompt(user_prompt, num_examples)
+        json_schema = self._build_schema(schemas, num_examples)
+
+        try:
+            result = await self.completion_provider.acomplete_with_json(prompt, self.system_prompt, json_schema=json_schema)
+
+            processed_result = self._process_generated_data(result, json_schema)
+
+            logger.info("Successfully generated data")
+
+            return self._unwrap_examples(processed_result, num_examples)
+
+        except Exception as e:
+            logger.error(f"Failed to generate JSON data: {str(e)}")
+            raise
+
+    async def agenerate_data_batch(
+        self,
+        schemas_list: List[Dict[str, Any]],
+        user_prompt: str,
+        num_examples: int = 1
+    ) -> List[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Asynchronously generate JSON data for several schemas concurrently.
+
+        Requests are issued concurrently; the completion provider bounds how
+        many are in flight at once.
+
+        Args:
+            schemas_list: JSON schemas to generate data for.
+            user_prompt: Additional instructions for data generation.
+            num_examples: Number of examples to generate per schema.
+
+        Returns:
+            The generated data for each schema, in the order given.
+
+        Raises:
+            Exception: If data generation fails for any schema.
+        """
+        return list(await asyncio.gather(
+            *(self.agenerate_data(schemas, user_prompt, num_examples) for schemas in schemas_list)
+        ))
+
+    def _build_prompt(self, user_prompt: str, num_examples: int) -> str:
+        """Build the data generation prompt.
+
+        Args:
+            user_prompt: Additional instructions for data generation.
+            num_examples: Number of examples to generate.
+
+        Returns:
+            The user prompt for the generation request.
+        """
+        # The fixed instructions live in the system prompt so providers can
+        # reuse their prompt-prefix cache; only the request details vary here.
+        if num_examples <= 1:
+            return _PROMPT_TMPL.format(num_examples=1, noun="example", user_prompt=user_prompt)
+
+        prompt = _PROMPT_TMPL.format(num_examples=num_examples, noun="examples", user_prompt=user_prompt)
+        return prompt + _ITEMS_PROMPT_TMPL.format(num_examples=num_examples)
+
+    def _build_schema(self, schemas: Dict[str, Any], num_examples: int) -> Dict[str, Any]:
+        """Build the response schema for the requested number of examples.
+
+        Multiple examples are requested as a single fixed-length array so they
+        are produced by one completion rather than one call per example. The
+        array is wrapped in an object under ``items``, since OpenAI structured
+        outputs require an object at the root.
+
+        Args:
+            schemas: JSON schema for a single example.
+            num_examples: Number of examples to generate.
+
+        Returns:
+            The schema to request from the completion provider.
+        """
+        if num_examples <= 1:
+            return schemas
+
+        return {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": schemas,
+                    "minItems": num_examples,
+                    "maxItems": num_examples,
+                },
+            },
+            "required": ["items"],
+        }
+
+    def _unwrap_examples(self, data: Any, num_examples: int) -> Any:
+        """Unwrap the examples array from a multi-example response.
+
+        Args:
+            data: The generated data.
+            num_examples: Number of examples requested.
+
+        Returns:
+            The list of examples when more than one was requested, otherwise
+            the data unchanged.
+        """
+        if num_examples > 1 and isinstance(data, dict) and "items" in data:
+            return data["items"]
+
+        return data
             
-    def _process_generated_data(self, data: Any) -> Any:
+    def _process_generated_data(self, data: Any, json_schema: Optional[Dict[str, Any]] = None) -> Any:
         """Process the generated data to format icons and other fields correctly.
         
         Args:
             data: The generated data structure
+            json_schema: Optional schema the data was generated from. When it
+                rules out icon objects, the walk is skipped.
             
         Returns:
             Processed data structure
         """
+        if json_schema is not None and not _schema_may_contain_icons(_json.dumps(json_schema)):
+            return data
+
         # Process data and transform icon names
-        self._process_data_recursive(data)
+        self._format_icon_names(data)
         return data
     
-    def _process_data_recursive(self, data):
+    def _format_icon_names(self, data: Any) -> None:
         """
-        Recursively process data structure to find and update icon names.
+        Walk a data structure in place to find and update icon names.
+
+        Uses an explicit stack rather than recursion, so deeply nested
+        payloads cost no extra Python frames.
         
         Args:
             data: Any data structure (dict, list, etc.) to process
         """
-        if isinstance(data, dict):
-            # Check if this dict matches the Icon interface
-            if (data.get('package') == 'lucide' and 
-                data.get('type') == 'icon' and 
-                'name' in data and 
-                isinstance(data['name'], str)):
-                # Transform hyphenated icon names to title case (e.g., "check-circle" -> "CheckCircle")
-                icon_name = data['name']
-                data['name'] = ''.join(x.title() for x in icon_name.split('-'))
-            
-            # Process all values
-            for value in data.values():
-                self._process_data_recursive(value)
-                
-        elif isinstance(data, list):
-            # Process all list items
-            for item in data:
-                self._process_data_recursive(item)
-    
\ No newline at end of file
+        if not isinstance(data, (dict, list)):
+            return
+
+        # Only containers are pushed, so scalar leaves never touch the stack
+        stack = [data]
+        while stack:
+            node = stack.pop()
+
+            # Parsed JSON only holds plain dicts and lists, so exact type checks
+            # take the fast path; subclasses fall back to isinstance
+            node_type = type(node)
+            if node_type is dict or (node_type is not list and isinstance(node, dict)):
+                # Check if this dict matches the Icon interface
+                if (node.get('package') == 'lucide' and 
+                    node.get('type') == 'icon' and 
+                    type(node.get('name')) is str):
+                    # Transform hyphenated icon names to title case (e.g., "check-circle" -> "CheckCircle")
+                    node['name'] = _pascal_case_icon(node['name'])
+
+                children = node.values()
+            else:
+                children = node
+
+            for child in children:
+                child_type = type(child)
+                if child_type is dict or child_type is list or isinstance(child, (dict, list)):
+                    stack.append(child)
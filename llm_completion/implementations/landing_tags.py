@@ -1,31 +1,81 @@
 """Implementation for finding tags for landing pages."""
 
-from typing import List, Optional, Dict, Any
-import json
+import asyncio
+from collections import Counter
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
-from ..completion import LiteLLMCompletion
 from ..logger import logger
+from ..resources.tag_data import ALL_TAGS, PRIMARY_STRUCTURAL_TAGS
 from ..tag_manager import TagManager
 
+if TYPE_CHECKING:
+    from ..completion import LiteLLMCompletion
+
+
+# Schema for the category/tags response; enums restrict the model to known tags
+_CATEGORY_TAGS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "data": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "category": {"type": "string", "enum": PRIMARY_STRUCTURAL_TAGS},
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ALL_TAGS}
+                    }
+                },
+                "required": ["category", "tags"]
+            }
+        }
+    },
+    "required": ["data"]
+}
+
+# Selection rules; kept constant so they form a cacheable prompt prefix
+_SELECTION_INSTRUCTIONS = (
+    "\nWhen selecting components for a landing page:\n"
+    "Choose components that work well together for a modern, effective landing page.\n"
+    "Format your response as a JSON array.\n\n"
+    "Remember to:\n"
+    "1. Select at least the requested number of components\n"
+    "2. Choose components that logically work together\n"
+    "3. Return only a valid JSON array of categories & tags\n\n"
+    "4. It should return category_tags_map: List of dict mapping category and tags e.g.\n"
+    "[{category: category1, tags: [tag1, tag2]}, {category: category2, tags: [tag3, tag4]}, ...]\n"
+)
+
+# User prompt template; only the request details vary per call
+_SELECTION_PROMPT_TMPL = (
+    "As a UI/UX expert, select at least {count} components in sequence for a landing page.\n\n"
+    "User Input: {user_input}\n"
+)
+
 
 class LandingPageTagFinder:
     """Component tag finder for landing pages."""
 
     def __init__(
         self, 
-        completion_provider: Optional[LiteLLMCompletion] = None,
+        completion_provider: Optional["LiteLLMCompletion"] = None,
+        use_api: bool = False,
     ) -> None:
         """Initialize the tag finder.
 
         Args:
             completion_provider: Optional completion provider to use when API is needed.
-                If not provided and use_api is True, a new instance will be created.
+                If not provided and use_api is True, the shared default provider is
+                used on first use.
             use_api: Whether to use the API for tag finding or use built-in tag data.
         """
-        self.completion_provider = completion_provider or LiteLLMCompletion()
-        
-        # Initialize the tag manager for local tag operations
-        # self.tag_manager = TagManager()
+        self.use_api = use_api
+
+        # Both are created on first use, so local-only callers never build a
+        # completion provider and API-only callers never build a tag manager
+        self._completion_provider = completion_provider
+        self._tag_manager: Optional[TagManager] = None
         
         self.system_prompt = (
             "You are a UI/UX expert specializing in landing page design."
@@ -186,65 +236,87 @@ This structure supports:
 
 Always include a primary tag (called category), Marketing Purpose Tag, and 2-5 secondary tags for each component. This ensures clarity while allowing flexibility in categorization.
 """
+            + _SELECTION_INSTRUCTIONS
         )
 
+    @property
+    def completion_provider(self) -> "LiteLLMCompletion":
+        """Completion provider for API lookups, created on first use."""
+        if self._completion_provider is None:
+            # Deferred so the local tag path never imports litellm
+            from ..completion import get_default_completion
+
+            self._completion_provider = get_default_completion()
+        return self._completion_provider
+
+    @property
+    def tag_manager(self) -> TagManager:
+        """Tag manager for local tag lookups, created on first use."""
+        if self._tag_manager is None:
+            self._tag_manager = TagManager()
+        return self._tag_manager
+
     def get_category_tags_map(
         self,
         user_input: str,
         count: int = 9,
         focus: Optional[str] = None
-    ) -> Dict[str, List[str]]:
+    ) -> List[Dict[str, Any]]:
         """
-        Return a dictionary mapping categories to their relevant tags for landing page components.
+        Return the selected landing page categories with their relevant tags.
 
         Args:
-            components: List of available component names.
+            user_input: Description of the landing page to select components for.
+                Only used when ``use_api`` is True.
             count: Minimum number of components to select.
             focus: Optional focus area (e.g., 'conversion', 'trust').
 
         Returns:
-            Dictionary mapping categories to their relevant tags.
+            List of dicts, one per selected component, each with a ``category``
+            and its ``tags``.
         """
+        if not self.use_api:
+            return self._local_category_tags_map(count, focus)
+
         logger.info(f"Finding landing page category tags from user input: {user_input}")
 
         try:
-            prompt = (
-                f"As a UI/UX expert, select at least {count} components in sequence for a landing page from the following list.\n"
-                "Choose components that work well together for a modern, effective landing page.\n"
-                "Format your response as a JSON array.\n\n"
-                f"User Input: {user_input}\n\n"
-                "Remember to:\n"
-                f"1. Select at least {count} components\n"
-                "2. Choose components that logically work together\n"
-                "3. Return only a valid JSON array of categories & tags\n\n"
-                "4. It should return category_tags_map: List of dict mapping category and tags e.g.\n"
-                "[{category: category1, tags: [tag1, tag2]}, {category: category2, tags: [tag3, tag4]}, ...]\n"
-            )
-            
-            # Define schema for the response
-            schema = {
-                "type": "object",
-                "properties": {
-                    "data": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                        "category": { "type": "string" },
-                        "tags": {
-                            "type": "array",
-                            "items": { "type": "string" }
-                        }
-                        },
-                        "required": ["category", "tags"]
-                    }
-                    }
-                },
-                "required": ["data"]
-                }
+            prompt = self._build_prompt(user_input, count)
+            result = self.completion_provider.complete_with_json(prompt, self.system_prompt, json_schema=_CATEGORY_TAGS_SCHEMA)
+
+        except Exception as e:
+            logger.error(f"API approach failed for finding landing page tags: {str(e)}")
+            raise
+
+        return result['data'] if 'data' in result else result
+
+    async def aget_category_tags_map(
+        self,
+        user_input: str,
+        count: int = 9,
+        focus: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronously return the selected landing page categories with their relevant tags.
+
+        Args:
+            user_input: Description of the landing page to select components for.
+                Only used when ``use_api`` is True.
+            count: Minimum number of components to select.
+            focus: Optional focus area (e.g., 'conversion', 'trust').
+
+        Returns:
+            List of dicts, one per selected component, each with a ``category``
+            and its ``tags``.
+        """
+        if not self.use_api:
+            return self._local_category_tags_map(count, focus)
+
+        logger.info(f"Finding landing page category tags from user input (async): {user_input}")
 
-            
-            result = self.completion_provider.complete_with_json(prompt, self.system_prompt, json_schema=schema)
+        try:
+            prompt = self._build_prompt(user_input, count)
+            result = await self.completion_provider.acomplete_with_json(prompt, self.system_prompt, json_schema=_CATEGORY_TAGS_SCHEMA)
 
         except Exception as e:
             logger.error(f"API approach failed for finding landing page tags: {str(e)}")
@@ -252,3 +324,108 @@ Always include a primary tag (called category), Marketing Purpose Tag, and 2-5 s
 
         return result['data'] if 'data' in result else result
 
+    async def aget_category_tags_map_many(
+        self,
+        user_inputs: List[str],
+        count: int = 9,
+        focus: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Asynchronously map categories to tags for several landing pages at once.
+
+        Requests are issued concurrently; the completion provider bounds how
+        many are in flight at once.
+
+        Args:
+            user_inputs: Descriptions of the landing pages to select components for.
+            count: Minimum number of components to select per page.
+            focus: Optional focus area (e.g., 'conversion', 'trust').
+
+        Returns:
+            The category/tags mapping for each input, in the order given.
+        """
+        return list(await asyncio.gather(
+            *(self.aget_category_tags_map(user_input, count, focus) for user_input in user_inputs)
+        ))
+
+    def get_tags_for_component(self, component_name: str) -> Dict[str, Any]:
+        """Get the built-in tags for a component.
+
+        Args:
+            component_name: Name of the component.
+
+        Returns:
+            Dictionary with the ``primary`` tag (or None) and all ``tags``.
+        """
+        tags = self.tag_manager.get_recommended_tags(component_name)
+
+        return {
+            "component": component_name,
+            "primary": tags[0] if tags else None,
+            "tags": tags,
+        }
+
+    def analyze_component_structure(self, components: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze a landing page's components using built-in tag data.
+
+        Args:
+            components: Components on the page, each a dict with at least a ``name``.
+
+        Returns:
+            Dictionary with per-component tags, tag coverage per category, the
+            essential sections that are missing, and recommendations.
+        """
+        names = [component.get("name", "") for component in components]
+        all_tags = [self.tag_manager.get_recommended_tags(name) if name else [] for name in names]
+        component_tags = [{"name": name, "tags": tags} for name, tags in zip(names, all_tags)]
+        sections = {tags[0] for tags in all_tags if tags}
+
+        # Count each distinct tag once, then fold the counts into categories
+        tag_usage = Counter(tag for tags in all_tags for tag in tags)
+        category_coverage: Dict[str, int] = {}
+        for tag, uses in tag_usage.items():
+            category = self.tag_manager.get_tag_category(tag)
+            if category:
+                category_coverage[category] = category_coverage.get(category, 0) + uses
+
+        # Sections every landing page should have, in page order
+        essentials = self.tag_manager.get_component_combinations(count=3)
+        missing = [section for section in essentials if section not in sections]
+
+        return {
+            "component_count": len(components),
+            "components": component_tags,
+            "category_coverage": category_coverage,
+            "missing_sections": missing,
+            "recommendations": [f"Add a '{section}' section" for section in missing],
+        }
+
+    def _local_category_tags_map(self, count: int, focus: Optional[str]) -> List[Dict[str, Any]]:
+        """Select components and their tags from built-in tag data.
+
+        Args:
+            count: Number of components to select.
+            focus: Optional focus area (e.g., 'conversion', 'trust').
+
+        Returns:
+            List of dicts mapping each selected category to its tags, in the
+            same shape as the API response.
+        """
+        return [
+            {"category": component, "tags": self.tag_manager.get_recommended_tags(component)}
+            for component in self.tag_manager.get_component_combinations(count=count, focus=focus)
+        ]
+
+    def _build_prompt(self, user_input: str, count: int) -> str:
+        """Build the component selection prompt.
+
+        Args:
+            user_input: Description of the landing page to select components for.
+            count: Minimum number of components to select.
+
+        Returns:
+            The user prompt for the tag request.
+        """
+        # The fixed selection rules live in the system prompt so providers can
+        # reuse their prompt-prefix cache; only the request details vary here.
+        return _SELECTION_PROMPT_TMPL.format(count=count, user_input=user_input)
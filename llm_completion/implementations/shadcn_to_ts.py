@@ -1,25 +1,116 @@
 """Implementation for converting Shadcn components to TypeScript."""
 
-from typing import Dict, Any, Optional, Tuple
-import json
-import re
+import asyncio
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 
-from ..completion import LiteLLMCompletion
 from ..logger import logger
-from ..utils import extract_code_from_markdown
+from ..resources.tag_data import ALL_TAGS, PRIMARY_STRUCTURAL_TAGS
+
+if TYPE_CHECKING:
+    from ..completion import LiteLLMCompletion
+
+
+# Schema for the TypeScript conversion response; enums restrict the model to known tags
+_CONVERSION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "component_ts_code": {"type": "string"},
+        "variation_ts_code": {"type": "string"},
+        "props": {"type": "string"},
+        "category": {"type": "string", "enum": PRIMARY_STRUCTURAL_TAGS},
+        "tags": {"type": "array", "items": {"type": "string", "enum": ALL_TAGS}},
+    },
+    "required": ["name", "component_ts_code", "props", "category", "tags"]
+}
+
+
+# User prompt templates; only the component (and demo) code varies per request
+_COMPONENT_PROMPT_TMPL = "```\n{code}\n\n```"
+_VARIATION_PROMPT_TMPL = (
+    "```\n{code}\n\n```"
+    "Given following concrete variation of above component. Create a typescript variation code for it "
+    "that will follow same guidelines as above and use above component as base with proper imports."
+    "\n```\n{demo}\n\n```"
+)
+
+
+# Conversion instructions; kept constant so they form a cacheable prompt prefix
+_CONVERSION_INSTRUCTIONS = (
+    "\nConvert the react component code given by the user to typescript compatible code with proper props types and export statement.\n"
+    "Convert any button to button embedded Link component using asChild of shadcn button prop. For e.g.\n\n"
+    """<Button asChild>
+      <Link href="/login">Login</Link>
+    </Button>\n\n"""
+    "Extract the user visible things like Text, Button, URL, Image, etc as props. \n"
+    "Ensure that the component is compatible with TypeScript and follows best practices for type definitions.\n"
+    "Create Props in same file.\n"
+    "Replace any hardcoded user visible values (including href, alt, src, etc), demo data, mockups, etc with appropriate props types, if required.\n"
+    "Remove default values. Props will handle those cases.\n"
+    "Add Optional Background image and optional Background color props at top level.\n\n"
+    "Give only json for component ts code, variation ts code (if applicable otherwise empty string) component name, props_file_name, component props name, category and tags in following format,\n\n"
+    "{\n"
+    '"name": "<component name>",\n'
+    '"component_ts_code": "<component ts code>",\n'
+    '"variation_ts_code": "<variation ts code>",\n'
+    '"props": "<component props name>",\n'
+    '"category": "<component category>",\n'
+    '"tags": [<component tags>]\n'
+    "}\n"
+)
+
+
+def _normalize_code(code: str) -> str:
+    """Canonicalize line endings and surrounding blank lines in component code.
+
+    Neither changes a component, so normalizing them lets copies that differ
+    only there share a cached conversion. Whitespace within and at the end of
+    lines is kept, since it can be significant in template literals and
+    multiline strings.
+
+    Args:
+        code: The component code.
+
+    Returns:
+        The code with ``\\n`` line endings and no leading or trailing blank lines.
+    """
+    lines = code.replace("\r\n", "\n").split("\n")
+
+    start, end = 0, len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+
+    return "\n".join(lines[start:end])
 
 
 class ShadcnToTypeScriptConverter:
     """Converter for Shadcn React components to TypeScript."""
 
-    def __init__(self, completion_provider: Optional[LiteLLMCompletion] = None) -> None:
+    __slots__ = ("completion_provider", "temperature", "system_prompt")
+
+    def __init__(
+        self,
+        completion_provider: Optional["LiteLLMCompletion"] = None,
+        temperature: float = 0.0,
+    ) -> None:
         """Initialize the converter.
 
         Args:
             completion_provider: Optional completion provider to use. If not provided,
-                a new instance will be created.
+                the shared default provider is used.
+            temperature: Sampling temperature for conversions. The default of 0
+                makes repeat conversions of the same component deterministic,
+                so they are served from the provider's response caches.
         """
-        self.completion_provider = completion_provider or LiteLLMCompletion()
+        if completion_provider is None:
+            # Deferred so importing the module does not load litellm
+            from ..completion import get_default_completion
+
+            completion_provider = get_default_completion()
+        self.completion_provider = completion_provider
+        self.temperature = temperature
         self.system_prompt = (
             "You are a TypeScript expert specializing in React component conversion."
             """
@@ -233,6 +324,7 @@ This structure supports:
 
 Always include a primary tag (called category), Marketing Purpose Tag, and 2-5 secondary tags for each component. This ensures clarity while allowing flexibility in categorization.
 """
+            + _CONVERSION_INSTRUCTIONS
         )
 
     def convert(self, component_code: str, demo_code: str = None) -> Dict[str, Any]:
@@ -243,56 +335,21 @@ Always include a primary tag (called category), Marketing Purpose Tag, and 2-5 s
             demo_code: Optional demo code for the component.
 
         Returns:
-            Tuple containing (typescript_component, props_file_content, metadata)
+            Dictionary with the converted ``component_ts_code`` and
+            ``variation_ts_code``, the component ``name``, its ``props`` type
+            name, ``category`` and ``tags``.
 
         Raises:
             Exception: If the conversion fails.
         """
         logger.info("Converting Shadcn component to TypeScript")
         
-        prompt = (
-            "Convert following react component code to typescript compatible code with proper props types and export statement.\n"
-            "Convert any button to button embedded Link component using asChild of shadcn button prop. For e.g.\n\n"
-            """<Button asChild>
-      <Link href="/login">Login</Link>
-    </Button>\n\n"""
-            "Extract the user visible things like Text, Button, URL, Image, etc as props. \n"
-            "Ensure that the component is compatible with TypeScript and follows best practices for type definitions.\n"
-            "Create Props in same file.\n"
-            "Replace any hardcoded user visible values (including href, alt, src, etc), demo data, mockups, etc with appropriate props types, if required.\n"
-            "Remove default values. Props will handle those cases.\n"
-            "Add Optional Background image and optional Background color props at top level.\n\n"
-            f"```\n{component_code}\n\n```"
-            + ("Given following concrete variation of above component. Create a typescript variation code for it that will follow same guidelines as above and use above component as base with proper imports." if demo_code else "")
-            + (f"\n```\n{demo_code}\n\n```" if demo_code else "")
-            + "Give only json for component ts code, variation ts code (if applicable otherwise empty string) component name, props_file_name, component props name, category and tags in following format,\n\n"
-            "{\n"
-            '"name": "<component name>",\n'
-            '"component_ts_code": "<component ts code>",\n'
-            '"variation_ts_code": "<variation ts code>",\n'
-            '"props": "<component props name>",\n'
-            '"category": "<component category>",\n'
-            '"tags": [<component tags>]\n'
-            "}\n"
-        )
+        prompt = self._build_prompt(component_code, demo_code)
 
         try:
-            # Define schema for TypeScript interface response
-            schema = {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "component_ts_code": {"type": "string"},
-                    "variation_ts_code": {"type": "string"},
-                    "props": {"type": "string"},
-                    "category": {"type": "string"},
-                    "tags": {"type": "array", "items": {"type": "string"}},
-                },
-                "required": ["name", "component_ts_code", "props", "category", "tags"]
-            }
-            
-            
-            result = self.completion_provider.complete_with_json(prompt, self.system_prompt, json_schema=schema)
+            result = self.completion_provider.complete_with_json(
+                prompt, self.system_prompt, json_schema=_CONVERSION_SCHEMA, temperature=self.temperature
+            )
             
             logger.info("Successfully converted component to TypeScript")
             
@@ -301,3 +358,110 @@ Always include a primary tag (called category), Marketing Purpose Tag, and 2-5 s
         except Exception as e:
             logger.error(f"Failed to convert component to TypeScript: {str(e)}")
             raise
+
+    async def aconvert(self, component_code: str, demo_code: str = None) -> Dict[str, Any]:
+        """Asynchronously convert a Shadcn component to TypeScript.
+
+        Args:
+            component_code: The React component code to convert.
+            demo_code: Optional demo code for the component.
+
+        Returns:
+            Dictionary with the converted component code and its metadata.
+
+        Raises:
+            Exception: If the conversion fails.
+        """
+        logger.info("Converting Shadcn component to TypeScript (async)")
+
+        prompt = self._build_prompt(component_code, demo_code)
+
+        try:
+            result = await self.completion_provider.acomplete_with_json(
+                prompt, self.system_prompt, json_schema=_CONVERSION_SCHEMA, temperature=self.temperature
+            )
+
+            logger.info("Successfully converted component to TypeScript")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to convert component to TypeScript: {str(e)}")
+            raise
+
+    def convert_many(
+        self,
+        component_codes: List[str],
+        demo_codes: Optional[List[Optional[str]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Convert several Shadcn components to TypeScript concurrently.
+
+        Synchronous wrapper around :meth:`aconvert_many`; must not be called
+        from a running event loop.
+
+        Args:
+            component_codes: The React component codes to convert.
+            demo_codes: Optional demo code for each component, aligned with
+                ``component_codes``.
+            return_exceptions: Whether to return a failed conversion's exception
+                in its slot instead of raising it.
+
+        Returns:
+            The conversion result for each component, in the order given.
+
+        Raises:
+            Exception: If any conversion fails and ``return_exceptions`` is False.
+        """
+        return asyncio.run(self.aconvert_many(component_codes, demo_codes, return_exceptions))
+
+    async def aconvert_many(
+        self,
+        component_codes: List[str],
+        demo_codes: Optional[List[Optional[str]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Asynchronously convert several Shadcn components to TypeScript.
+
+        Requests are issued concurrently; the completion provider bounds how
+        many are in flight at once.
+
+        Args:
+            component_codes: The React component codes to convert.
+            demo_codes: Optional demo code for each component, aligned with
+                ``component_codes``.
+            return_exceptions: Whether to return a failed conversion's exception
+                in its slot instead of raising it, so one bad component does
+                not discard the rest of the batch.
+
+        Returns:
+            The conversion result for each component, in the order given.
+
+        Raises:
+            Exception: If any conversion fails and ``return_exceptions`` is False.
+        """
+        demo_codes = demo_codes or [None] * len(component_codes)
+
+        return list(await asyncio.gather(
+            *(self.aconvert(code, demo) for code, demo in zip(component_codes, demo_codes)),
+            return_exceptions=return_exceptions,
+        ))
+
+    def _build_prompt(self, component_code: str, demo_code: Optional[str] = None) -> str:
+        """Build the conversion prompt for a component.
+
+        Args:
+            component_code: The React component code to convert.
+            demo_code: Optional demo code for the component.
+
+        Returns:
+            The user prompt for the conversion request.
+        """
+        # The stable conversion instructions live in the system prompt so that
+        # providers can reuse their prompt-prefix cache; only the code varies here.
+        if demo_code:
+            return _VARIATION_PROMPT_TMPL.format(
+                code=_normalize_code(component_code), demo=_normalize_code(demo_code)
+            )
+
+        return _COMPONENT_PROMPT_TMPL.format(code=_normalize_code(component_code))
@@ -149,6 +149,10 @@ TAG_CATEGORIES = {
     "audience": AUDIENCE_STAGE_TAGS,
 }
 
+# Frozen views of the tag lists for constant-time membership tests
+ALL_TAGS_SET = frozenset(ALL_TAGS)
+TAG_CATEGORY_SETS = {category: frozenset(tags) for category, tags in TAG_CATEGORIES.items()}
+
 # Common tag combinations for specific components
 COMMON_COMPONENT_TAGS = {
     "hero": {
@@ -342,8 +346,7 @@ def validate_tags(tags: List[str]) -> List[str]:
     Returns:
         List of valid tags.
     """
-    valid_tags = set(ALL_TAGS)
-    return [tag for tag in tags if tag in valid_tags]
+    return [tag for tag in tags if tag in ALL_TAGS_SET]
 
 
 def export_tags_to_json(filepath: str) -> None:
@@ -3,6 +3,7 @@
 from typing import Dict, List, Any, Optional, Tuple, Set
 import logging
 from collections import Counter
+from functools import lru_cache
 
 from .resources.tag_data import (
     get_all_tags,
@@ -11,11 +12,96 @@ from .resources.tag_data import (
     filter_tags,
     validate_tags,
     TAG_CATEGORIES,
+    TAG_CATEGORY_SETS,
+    ALL_TAGS_SET,
     COMMON_COMPONENT_TAGS
 )
 from .logger import logger
 
 
+# First category each tag appears in, for constant-time category lookups;
+# categories are walked in reverse so earlier ones win
+_TAG_TO_CATEGORY: Dict[str, str] = {
+    tag: category
+    for category, tags in reversed(list(TAG_CATEGORIES.items()))
+    for tag in tags
+}
+
+
+@lru_cache(maxsize=256)
+def _recommended_tags(component_name: str) -> Tuple[str, ...]:
+    """Get recommended tags for a component; memoized per component name.
+
+    Args:
+        component_name: Name of the component to get tags for.
+
+    Returns:
+        Tuple of recommended tags.
+    """
+    try:
+        component_tags = get_recommended_tags_for_component(component_name)
+        recommended = [component_tags["primary"]] + component_tags["recommended"]
+        return tuple(recommended)
+    except ValueError as e:
+        logger.warning(f"No predefined tags for component '{component_name}': {str(e)}")
+        # Fallback to primary structural tag if possible
+        component_name_lower = component_name.lower()
+        for tag in TAG_CATEGORIES["primary"]:
+            if tag in component_name_lower:
+                logger.info(f"Using partial match for component '{component_name}': {tag}")
+                return (tag,)
+        # No match found
+        logger.info(f"No tag match found for component '{component_name}', returning empty list")
+        return ()
+    except Exception as e:
+        logger.error(f"Error getting recommended tags for '{component_name}': {str(e)}")
+        return ()
+
+
+@lru_cache(maxsize=256)
+def _component_combinations(count: int, focus: Optional[str]) -> Tuple[str, ...]:
+    """Get recommended component combinations; memoized per (count, focus).
+
+    Args:
+        count: Minimum number of components to return.
+        focus: Optional focus area (e.g., 'conversion', 'trust', 'awareness').
+
+    Returns:
+        Tuple of recommended component names.
+    """
+    # Essential components that should be included in any landing page
+    essential = ["hero", "features", "cta"]
+    
+    # Add focus-specific components
+    focus_components = {
+        "conversion": ["pricing", "testimonials", "faq"],
+        "trust": ["testimonials", "partners", "team"],
+        "awareness": ["showcase", "stats", "gallery"],
+        "engagement": ["newsletter", "contact", "process"]
+    }
+    
+    # Ordered result plus a set for constant-time membership tests
+    result = essential.copy()
+    seen = set(result)
+    
+    # Add focus-specific components if requested
+    if focus and focus in focus_components:
+        for component in focus_components[focus]:
+            if component not in seen:
+                result.append(component)
+                seen.add(component)
+    
+    # Add more components if needed to reach the count
+    for component in COMMON_COMPONENT_TAGS:
+        if len(result) >= count:
+            break
+        if component not in seen:
+            result.append(component)
+            seen.add(component)
+    
+    return tuple(result[:count])
+
+
 class TagManager:
     """Manager for landing page component tags."""
     
@@ -29,7 +115,7 @@ class TagManager:
                 categories_tags.extend(TAG_CATEGORIES[category])
             
             # Ensure all category tags are in ALL_TAGS
-            missing_tags = [tag for tag in categories_tags if tag not in all_tags]
+            missing_tags = [tag for tag in categories_tags if tag not in ALL_TAGS_SET]
             if missing_tags:
                 logger.warning(f"Some tags in categories are missing from ALL_TAGS: {missing_tags}")
             
@@ -53,24 +139,18 @@ class TagManager:
         Returns:
             List of recommended tags.
         """
-        try:
-            component_tags = get_recommended_tags_for_component(component_name)
-            recommended = [component_tags["primary"]] + component_tags["recommended"]
-            return recommended
-        except ValueError as e:
-            logger.warning(f"No predefined tags for component '{component_name}': {str(e)}")
-            # Fallback to primary structural tag if possible
-            component_name_lower = component_name.lower()
-            for tag in TAG_CATEGORIES["primary"]:
-                if tag in component_name_lower:
-                    logger.info(f"Using partial match for component '{component_name}': {tag}")
-                    return [tag]
-            # No match found
-            logger.info(f"No tag match found for component '{component_name}', returning empty list")
-            return []
-        except Exception as e:
-            logger.error(f"Error getting recommended tags for '{component_name}': {str(e)}")
-            return []
+        return list(_recommended_tags(component_name))
+    
+    def get_tag_category(self, tag: str) -> Optional[str]:
+        """Get the category a tag belongs to.
+
+        Args:
+            tag: The tag to look up.
+
+        Returns:
+            The first category containing the tag, or None if it is unknown.
+        """
+        return _TAG_TO_CATEGORY.get(tag)
     
     def get_component_combinations(self, count: int = 5, focus: Optional[str] = None) -> List[str]:
         """Get recommended component combinations for a landing page.
@@ -82,34 +162,7 @@ class TagManager:
         Returns:
             List of recommended component names.
         """
-        # Essential components that should be included in any landing page
-        essential = ["hero", "features", "cta"]
-        
-        # Add focus-specific components
-        focus_components = {
-            "conversion": ["pricing", "testimonials", "faq"],
-            "trust": ["testimonials", "partners", "team"],
-            "awareness": ["showcase", "stats", "gallery"],
-            "engagement": ["newsletter", "contact", "process"]
-        }
-        
-        result = essential.copy()
-        
-        # Add focus-specific components if requested
-        if focus and focus in focus_components:
-            for component in focus_components[focus]:
-                if component not in result:
-                    result.append(component)
-        
-        # Add more components if needed to reach the count
-        all_components = list(COMMON_COMPONENT_TAGS.keys())
-        for component in all_components:
-            if len(result) >= count:
-                break
-            if component not in result:
-                result.append(component)
-        
-        return result[:count]
+        return list(_component_combinations(count, focus))
     
     def search_tags(self, query: str) -> List[str]:
         """Search for tags matching a query.
@@ -150,11 +203,7 @@ class TagManager:
         
         try:
             # Try to determine which category the primary tag belongs to
-            primary_category = None
-            for category, tags in TAG_CATEGORIES.items():
-                if primary_tag in tags:
-                    primary_category = category
-                    break
+            primary_category = _TAG_TO_CATEGORY.get(primary_tag)
             
             # Get additional tags from different categories
             categories_to_try = list(TAG_CATEGORIES.keys())
@@ -193,19 +242,18 @@ class TagManager:
         messages = []
         
         # Check if tags exist
-        invalid_tags = [tag for tag in tags if tag not in get_all_tags()]
+        invalid_tags = [tag for tag in tags if tag not in ALL_TAGS_SET]
         if invalid_tags:
             messages.append(f"Invalid tags: {', '.join(invalid_tags)}")
         
         # Check if component has a primary structural tag
-        has_primary = any(tag in TAG_CATEGORIES["primary"] for tag in tags)
-        if not has_primary:
+        if TAG_CATEGORY_SETS["primary"].isdisjoint(tags):
             messages.append("Missing primary structural tag")
         
         # Check for tag coverage (at least one tag from important categories)
         important_categories = ["function", "content", "technical"]
         for category in important_categories:
-            if not any(tag in TAG_CATEGORIES[category] for tag in tags):
+            if TAG_CATEGORY_SETS[category].isdisjoint(tags):
                 messages.append(f"Missing tag from '{category}' category")
         
         return len(messages) == 0, messages
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Utility functions for the LLM completion library."""
 
-import json
-from typing import Dict, Any
+import string
+from typing import Dict, Any, Iterator, Tuple
+
+from . import _json
 
 
 def format_prompt(template: str, **kwargs: Any) -> str:
@@ -30,41 +32,86 @@ def validate_json_response(response: str) -> Dict[str, Any]:
         ValueError: If the response doesn't contain valid JSON.
     """
     # Try to extract JSON from markdown code blocks if present
-    if "```json" in response:
+    json_content = extract_code_from_markdown(response, "json")
+    if json_content:
         try:
-            json_content = response.split("```json")[1].split("```")[0].strip()
-            return json.loads(json_content)
-        except (IndexError, json.JSONDecodeError):
+            return _json.loads(json_content)
+        except _json.JSONDecodeError:
             pass
 
     # Try direct JSON parsing
     try:
-        return json.loads(response)
-    except json.JSONDecodeError:
+        return _json.loads(response)
+    except _json.JSONDecodeError:
         raise ValueError("Response does not contain valid JSON")
 
 
+# Characters of a fence language identifier, e.g. "tsx", "c++" or "objective-c"
+_FENCE_LANGUAGE_CHARS = frozenset(string.ascii_letters + string.digits + "_+-.#")
+
+
+def _fence_language_end(text: str, pos: int) -> int:
+    """Find the end of the language identifier following an opening fence.
+
+    Args:
+        text: The markdown content.
+        pos: Index just past the opening fence.
+
+    Returns:
+        Index just past the language identifier; the block content starts here.
+    """
+    end = pos
+    while end < len(text) and text[end] in _FENCE_LANGUAGE_CHARS:
+        end += 1
+
+    return end
+
+
+def _iter_code_blocks(markdown: str) -> Iterator[Tuple[str, str]]:
+    """Yield fenced code blocks from markdown content in a single pass.
+
+    The content may start on the fence line, as in ```` ```json {"a": 1}``` ````.
+
+    Args:
+        markdown: The markdown content containing code blocks.
+
+    Yields:
+        ``(language, code)`` for each block in document order, with '' as the
+        language of blocks without one and the code stripped. An unterminated
+        final block runs to the end of the content.
+    """
+    pos = 0
+
+    while True:
+        start = markdown.find("```", pos)
+        if start == -1:
+            return
+
+        content_start = _fence_language_end(markdown, start + 3)
+
+        end = markdown.find("```", content_start)
+        if end == -1:
+            end = len(markdown)
+
+        yield markdown[start + 3:content_start], markdown[content_start:end].strip()
+        pos = end + 3
+
+
 def extract_code_from_markdown(markdown: str, language: str = "") -> str:
     """Extract code blocks from markdown content.
 
     Args:
         markdown: The markdown content containing code blocks.
         language: Optional language identifier to extract specific language blocks.
+            It must match the fence exactly, so "ts" does not match a "tsx" block.
 
     Returns:
         Extracted code or empty string if no matching code block found.
     """
     language = language.strip()
-    marker = f"```{language}" if language else "```"
-    
-    if marker not in markdown:
-        return ""
-    
-    parts = markdown.split(marker)
-    if len(parts) < 2:
-        return ""
-    
-    # Get the content after the first marker and before the next closing marker
-    code_block = parts[1].split("```")[0]
-    
-    return code_block.strip()
\ No newline at end of file
+
+    for block_language, code in _iter_code_blocks(markdown):
+        if not language or block_language == language:
+            return code
+
+    return ""
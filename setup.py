@@ -23,8 +23,12 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "litellm==1.77.1",
+        "httpx>=0.23.0",
         "tenacity>=8.2.0",  # Updated version
         "python-dotenv>=0.19.0",
         "jsonschema>=4.0.0",  # Added for schema validation
     ],
+    extras_require={
+        "fast": ["orjson>=3.6.0"],  # Faster JSON encoding and parsing
+    },
 )
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Shared fixtures for the llm_completion tests."""
+
+import os
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+import pytest
+
+# Config requires an API key at import time; no request reaches the network
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+
+def make_response(content: str) -> Any:
+    """Build a minimal LiteLLM completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=None,
+    )
+
+
+@pytest.fixture
+def llm_reply(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], List[dict]]:
+    """Make ``litellm.completion`` and ``litellm.acompletion`` return a fixed reply.
+
+    Returns:
+        A function that sets the reply text and returns the list of recorded
+        request kwargs.
+    """
+    import litellm
+
+    calls: List[dict] = []
+
+    def set_reply(content: str) -> List[dict]:
+        def fake_completion(**kwargs: Any) -> Any:
+            calls.append(kwargs)
+            return make_response(content)
+
+        async def fake_acompletion(**kwargs: Any) -> Any:
+            return fake_completion(**kwargs)
+
+        monkeypatch.setattr(litellm, "completion", fake_completion)
+        monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+        return calls
+
+    return set_reply
@@ -0,0 +1,38 @@
+"""Tests for the response caches."""
+
+import sqlite3
+
+from llm_completion.cache import LLMCache
+
+
+def _row_count(cache: LLMCache) -> int:
+    with sqlite3.connect(cache.path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def test_llm_cache_round_trip(tmp_path):
+    cache = LLMCache(str(tmp_path))
+    cache.set("key", {"a": 1})
+
+    assert cache.get("key") == {"a": 1}
+    assert cache.stats == {"hits": 1, "misses": 0}
+
+
+def test_expired_entry_is_deleted_on_get(tmp_path):
+    cache = LLMCache(str(tmp_path))
+    cache.set("key", {"a": 1}, expire=-1)
+
+    assert cache.get("key") is None
+    assert _row_count(cache) == 0
+
+
+def test_expired_entries_are_deleted_on_open(tmp_path):
+    cache = LLMCache(str(tmp_path))
+    cache.set("old", {"a": 1}, expire=-1)
+    cache.set("fresh", {"b": 2}, expire=3600)
+    cache.close()
+
+    reopened = LLMCache(str(tmp_path))
+
+    assert _row_count(reopened) == 1
+    assert reopened.get("fresh") == {"b": 2}
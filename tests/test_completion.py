@@ -0,0 +1,68 @@
+"""Tests for JSON completions in LiteLLMCompletion."""
+
+import asyncio
+
+import pytest
+
+from llm_completion.completion import LiteLLMCompletion, _prompt_cache_key
+from llm_completion.config import config
+
+
+@pytest.fixture
+def completion() -> LiteLLMCompletion:
+    """A provider without response caches."""
+    return LiteLLMCompletion(memory_cache_size=0)
+
+
+def test_complete_with_json_accepts_unknown_schema_type(completion, llm_reply):
+    llm_reply('{"a": 1}')
+
+    assert completion.complete_with_json("p", json_schema={"type": "foo"}) == {"a": 1}
+
+
+def test_complete_with_json_accepts_property_named_type(completion, llm_reply):
+    from llm_completion.implementations.json_generator import JsonSchemaDataGenerator
+
+    llm_reply('{"type": "card", "title": "Hello"}')
+    generator = JsonSchemaDataGenerator(completion)
+
+    result = generator.generate_data({"type": {"type": "string"}, "title": {"type": "string"}}, "p")
+
+    assert result == {"type": "card", "title": "Hello"}
+
+
+def test_complete_with_json_accepts_unresolvable_ref(completion, llm_reply, caplog):
+    llm_reply('{"a": 1}')
+
+    assert completion.complete_with_json("p", json_schema={"$ref": "#/$defs/missing"}) == {"a": 1}
+    assert "unresolvable JSON schema reference" in caplog.text
+
+
+def test_complete_with_json_logs_schema_mismatch(completion, llm_reply, caplog):
+    llm_reply('{"name": 1}')
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+    assert completion.complete_with_json("p", json_schema=schema) == {"name": 1}
+    assert "at name" in caplog.text
+
+
+def test_acomplete_installs_shared_client_instead_of_forwarding_it(completion, llm_reply, monkeypatch):
+    import litellm
+
+    calls = llm_reply("ok")
+    monkeypatch.setattr(litellm, "aclient_session", None)
+    completion.providers = ["openai"]
+
+    async def run():
+        async with completion:
+            assert litellm.aclient_session is completion._session is not None
+            return await completion.acomplete("p", system_prompt="sys")
+
+    assert asyncio.run(run()) == "ok"
+    assert calls == [{
+        "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "p"}],
+        "drop_params": True,
+        **config.get_litellm_params("openai"),
+        "extra_body": {"prompt_cache_key": _prompt_cache_key("sys")},
+    }]
+    assert litellm.aclient_session is None
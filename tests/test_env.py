@@ -0,0 +1,24 @@
+"""Tests for cached .env loading."""
+
+import os
+
+from llm_completion._env import load_dotenv_cached
+
+
+def test_finds_dotenv_in_parent_directory(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("LLM_COMPLETION_TEST_VAR=found\n")
+    subdir = tmp_path / "examples"
+    subdir.mkdir()
+    monkeypatch.chdir(subdir)
+    monkeypatch.delenv("LLM_COMPLETION_TEST_VAR", raising=False)
+
+    assert load_dotenv_cached()
+    assert os.environ["LLM_COMPLETION_TEST_VAR"] == "found"
+
+    monkeypatch.delenv("LLM_COMPLETION_TEST_VAR")
+
+
+def test_missing_dotenv_returns_false(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert not load_dotenv_cached(str(tmp_path / ".env"))
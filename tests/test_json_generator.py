@@ -0,0 +1,117 @@
+"""Tests for JsonSchemaDataGenerator."""
+
+import pytest
+
+from llm_completion import _json
+from llm_completion.implementations.json_generator import (
+    JsonSchemaDataGenerator,
+    _schema_may_contain_icons,
+)
+
+
+def may_contain_icons(schema):
+    return _schema_may_contain_icons(_json.dumps(schema))
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        # Untyped subschema
+        {"type": "object", "properties": {"icon": {}}, "additionalProperties": False},
+        # Nullable object
+        {
+            "type": "object",
+            "properties": {"icon": {"type": ["object", "null"]}},
+            "additionalProperties": False,
+        },
+        # additionalProperties omitted
+        {"type": "object", "properties": {"title": {"type": "string"}}},
+    ],
+)
+def test_open_schemas_may_contain_icons(schema):
+    assert may_contain_icons(schema)
+
+
+def test_closed_schema_rules_out_icons():
+    schema = {
+        "type": "object",
+        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+        "additionalProperties": False,
+    }
+
+    assert not may_contain_icons(schema)
+
+
+def test_property_map_is_checked_by_field():
+    closed = {
+        "title": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "image": {"type": "object", "properties": {"src": {"type": "string"}}, "additionalProperties": False},
+    }
+
+    assert not may_contain_icons(closed)
+    assert may_contain_icons({**closed, "icon": {}})
+
+
+def test_process_generated_data_skips_walk_for_closed_property_map():
+    from llm_completion.completion import LiteLLMCompletion
+
+    generator = JsonSchemaDataGenerator(LiteLLMCompletion(memory_cache_size=0))
+    data = {"title": {"package": "lucide", "type": "icon", "name": "check-circle"}}
+
+    assert generator._process_generated_data(data, {"title": {"type": "string"}}) == data
+    assert data["title"]["name"] == "check-circle"
+    assert generator._process_generated_data(data, {"title": {}})["title"]["name"] == "CheckCircle"
+
+
+def test_generate_data_formats_icons_in_untyped_fields(llm_reply):
+    from llm_completion.completion import LiteLLMCompletion
+
+    llm_reply('{"icon": {"package": "lucide", "type": "icon", "name": "check-circle"}}')
+    generator = JsonSchemaDataGenerator(LiteLLMCompletion(memory_cache_size=0))
+
+    result = generator.generate_data({"type": "object", "properties": {"icon": {}}}, "p")
+
+    assert result["icon"]["name"] == "CheckCircle"
+
+
+def test_single_example_prompt(llm_reply):
+    from llm_completion.completion import LiteLLMCompletion
+
+    calls = llm_reply('{"title": "a"}')
+    generator = JsonSchemaDataGenerator(LiteLLMCompletion(memory_cache_size=0))
+
+    generator.generate_data({"title": {"type": "string"}}, "p")
+
+    prompt = calls[0]["messages"][-1]["content"]
+    assert prompt.startswith("Generate 1 example of JSON data.")
+    assert '"items"' not in prompt
+
+
+def test_multiple_examples_use_an_object_root(llm_reply):
+    from llm_completion.completion import LiteLLMCompletion
+
+    calls = llm_reply('{"items": [{"title": "a"}, {"title": "b"}]}')
+    generator = JsonSchemaDataGenerator(LiteLLMCompletion(memory_cache_size=0))
+    schema = {"type": "object", "properties": {"title": {"type": "string"}}}
+
+    result = generator.generate_data(schema, "p", num_examples=2)
+
+    assert result == [{"title": "a"}, {"title": "b"}]
+    assert "Generate 2 examples of JSON data." in calls[0]["messages"][-1]["content"]
+    sent_schema = calls[0]["response_format"]["json_schema"]["schema"]
+    assert sent_schema["type"] == "object"
+    assert sent_schema["properties"]["items"]["items"] == schema
+
+
+def test_agenerate_data_unwraps_multiple_examples(llm_reply):
+    import asyncio
+
+    from llm_completion.completion import LiteLLMCompletion
+
+    llm_reply('{"items": [{"title": "a"}, {"title": "b"}]}')
+    generator = JsonSchemaDataGenerator(LiteLLMCompletion(memory_cache_size=0))
+
+    result = asyncio.run(generator.agenerate_data({"type": "object"}, "p", num_examples=2))
+
+    assert result == [{"title": "a"}, {"title": "b"}]
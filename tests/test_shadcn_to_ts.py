@@ -0,0 +1,15 @@
+"""Tests for ShadcnToTypeScriptConverter prompt building."""
+
+from llm_completion.implementations.shadcn_to_ts import _normalize_code
+
+
+def test_normalize_code_unifies_line_endings_and_blank_lines():
+    code = "\r\n  \r\nconst A = 1;\r\nexport default A;\r\n\r\n"
+
+    assert _normalize_code(code) == "const A = 1;\nexport default A;"
+
+
+def test_normalize_code_keeps_whitespace_inside_lines():
+    code = "  const text = `line one   \n    line two\t`;  \n"
+
+    assert _normalize_code(code) == "  const text = `line one   \n    line two\t`;  "
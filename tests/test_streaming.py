@@ -0,0 +1,36 @@
+"""Tests for streamed completions."""
+
+import asyncio
+from types import SimpleNamespace
+
+from llm_completion.completion import LiteLLMCompletion
+
+MARKDOWN = 'Here:\n```tsx\nconst A = `a``b`\n```\nand ```json {"a": 1}``` then ```ts\nB'
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def _pieces():
+    return [MARKDOWN[i:i + 3] for i in range(0, len(MARKDOWN), 3)] + [None]
+
+
+def test_astream_yields_text_chunks(monkeypatch):
+    import litellm
+
+    async def fake_acompletion(**kwargs):
+        async def response():
+            for piece in _pieces():
+                yield _chunk(piece)
+
+        return response()
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    async def collect():
+        return [chunk async for chunk in LiteLLMCompletion(memory_cache_size=0).astream("p")]
+
+    chunks = asyncio.run(collect())
+
+    assert "".join(chunks) == MARKDOWN
@@ -0,0 +1,46 @@
+"""Tests for the markdown and JSON helpers."""
+
+import pytest
+
+from llm_completion.utils import extract_code_from_markdown, validate_json_response
+
+
+@pytest.mark.parametrize(
+    "markdown, language, expected",
+    [
+        ("```tsx\nconst A = 1\n```", "tsx", "const A = 1"),
+        # Content on the fence line
+        ('```json {"a": 1}```', "json", '{"a": 1}'),
+        ('```json{"a": 1}```', "json", '{"a": 1}'),
+        # Languages match exactly, not by prefix
+        ("```tsx\nA\n```\n```ts\nB\n```", "ts", "B"),
+        ("```typescript\nA\n```", "ts", ""),
+        # No language returns the first block of any language
+        ("text\n```tsx\nA\n```", "", "A"),
+        ("``` plain ```", "", "plain"),
+        # Unterminated block runs to the end
+        ("```json\n{}", "json", "{}"),
+        ("no fences here", "json", ""),
+        ("```tsx\nA\n```", "json", ""),
+    ],
+)
+def test_extract_code_from_markdown(markdown, language, expected):
+    assert extract_code_from_markdown(markdown, language) == expected
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '{"a": 1}',
+        '```json\n{"a": 1}\n```',
+        '```json {"a": 1}```',
+        'Here you go:\n```json\n{"a": 1}',
+    ],
+)
+def test_validate_json_response(response):
+    assert validate_json_response(response) == {"a": 1}
+
+
+def test_validate_json_response_rejects_prose():
+    with pytest.raises(ValueError):
+        validate_json_response("no json here")